@@ -7,6 +7,8 @@ Created on Mon Oct  7 10:09:40 2019
 import math
 import numpy as np
 
+from functools import lru_cache
+
 from dxfwrite.mixins import SubscriptAttributes
 from dxfwrite import const
 from dxfwrite.algebra import rotate_2d
@@ -178,6 +180,30 @@ class SkewRect(SolidPline):
 
         return dy
     
+@lru_cache(maxsize=1024)
+def _curve_rect_points(r0,height,roffset,angle,segments,dr):
+    """Pre-transform point table for CurveRect, memoized: bend shapes repeat
+    with identical (radius, height, angle) parameters across a wafer."""
+    rmin = r0+dr+roffset
+    rmax = r0+height+dr+roffset
+    dTheta = angle/segments
+    if rmin <=0:
+        if angle%(2*math.pi) != math.radians(90):  #not designed for doing more than one nicely rounded corner at a time
+            rmin = 0
+        pts = [(0,rmin-r0),(rmax*math.sin(angle)-rmin,rmax*math.cos(angle)-r0+rmin)]
+        pts = pts + [(rmax*math.sin(angle-(i+0.5)*dTheta)-rmin,rmax*math.cos(angle-(i+0.5)*dTheta)-r0) for i in range(segments)] + [(0,rmax - r0)]
+    else:
+        pts = [(0,rmin-r0)]+[(rmin*math.sin((i+0.5)*dTheta),rmin*math.cos((i+0.5)*dTheta)-r0) for i in range(segments)]+[(rmin*math.sin(angle),rmin*math.cos(angle)-r0)]
+        pts = pts + [(rmax*math.sin(angle),rmax*math.cos(angle)-r0)] + [(rmax*math.sin(angle-(i+0.5)*dTheta),rmax*math.cos(angle-(i+0.5)*dTheta)-r0) for i in range(segments)] + [(0,rmax - r0)]
+    return rmin,rmax,tuple(vsub(pt,(0,dr)) for pt in pts)
+
+@lru_cache(maxsize=1024)
+def _inside_curve_points(r0,angle,curve_angle,segments):
+    """Pre-transform point table for InsideCurve, memoized like _curve_rect_points."""
+    center = (-r0/math.tan(angle/2),-r0)
+    dTheta = curve_angle/segments
+    return tuple([(0,0)]+[vadd((r0*math.sin(i*dTheta),r0*math.cos(i*dTheta)),center) for i in range(segments+1)])
+
 class CurveRect(SolidPline):
     ''' Curved rectangle consisting of a single Polyline and a number of background solids
         Connects two flat edges separated by an angle: one or two connecting edges may be curved
@@ -256,23 +282,9 @@ class CurveRect(SolidPline):
                        for point in self.points]
     
     def _calc_points(self,align):
-        #align=self._get_align_vector()
-        self.rmin=self.r0+align[1]+self.roffset
-        self.rmax=self.r0+self.height+align[1]+self.roffset
-        
-        dTheta = self.angle/self.segments
-        pts = []
-        if self.rmin <=0:
-            if self.angle%(2*math.pi) != math.radians(90):  #not designed for doing more than one nicely rounded corner at a time
-                self.rmin = 0
-            pts = [(0,self.rmin-self.r0),(self.rmax*math.sin(self.angle)-self.rmin,self.rmax*math.cos(self.angle)-self.r0+self.rmin)]
-            pts = pts + [(self.rmax*math.sin(self.angle-(i+0.5)*dTheta)-self.rmin,self.rmax*math.cos(self.angle-(i+0.5)*dTheta)-self.r0) for i in range(self.segments)] + [(0,self.rmax - self.r0)]
-        else:
-            pts = [(0,self.rmin-self.r0)]+[(self.rmin*math.sin((i+0.5)*dTheta),self.rmin*math.cos((i+0.5)*dTheta)-self.r0) for i in range(self.segments)]+[(self.rmin*math.sin(self.angle),self.rmin*math.cos(self.angle)-self.r0)]
-            pts = pts + [(self.rmax*math.sin(self.angle),self.rmax*math.cos(self.angle)-self.r0)] + [(self.rmax*math.sin(self.angle-(i+0.5)*dTheta),self.rmax*math.cos(self.angle-(i+0.5)*dTheta)-self.r0) for i in range(self.segments)] + [(0,self.rmax - self.r0)]
-        
-        
-        return [vsub(pt,align) for pt in pts]
+        #geometry only depends on the shape parameters; fetch from the shared cache
+        self.rmin,self.rmax,pts = _curve_rect_points(self.r0,self.height,self.roffset,self.angle,self.segments,align[1])
+        return list(pts)
     
     def _build_polyline(self):
         '''Build the polyline (key component)'''
@@ -301,6 +313,21 @@ class CurveRect(SolidPline):
         return self._build() 
 
     
+@lru_cache(maxsize=1024)
+def _round_rect_points(width,height,radius,roundCorners,dx,dy,cx,cy,ptDensity):
+    """Pre-transform point table for RoundRect, memoized like _curve_rect_points:
+    pad and tether outlines repeat with identical dimensions across a wafer."""
+    square_points = [(0., 0.), (width, 0.), (width, height), (0., height)]
+    points = [((0.+dx)*cx,(height/2+dy)*cy)]
+    quadrants = [3,4,1,2]
+    for i,sqpt in enumerate(square_points):
+        if roundCorners[i]:
+            for p in cornerRound(sqpt, quadrants[i], radius,clockwise=False,ptDensity=ptDensity):
+                points.append(((dx+p[0])*cx,(dy+p[1])*cy))
+        else:
+            points.append(((dx+sqpt[0])*cx,(dy+sqpt[1])*cy))
+    return tuple(points)
+
 class RoundRect(SolidPline):
     ''' Rectangle with rounded edges. Consists of a closed polyline and multiple solids faces.
         NOTE: does not cover negative width / height like rectangle()
@@ -332,21 +359,11 @@ class RoundRect(SolidPline):
         
 
     def _calc_corners(self):
-        square_points = [(0., 0.), (self.width, 0.), (self.width, self.height),
-                  (0., self.height)]
-        align_vector=self._get_align_vector()
-        
-        points = [self._get_flipped_point(vadd((0.,self.height/2),align_vector))]
-        quadrants = [3,4,1,2]
-        
-        for i,sqpt in enumerate(square_points):
-            if self.roundCorners[i]:
-                for p in cornerRound(sqpt, quadrants[i], self.radius,clockwise=False,ptDensity=self.ptDensity):
-                    points.append(self._get_flipped_point(vadd(align_vector,p)))
-            else:
-                points.append(self._get_flipped_point(vadd(align_vector,sqpt)))
-        
-        return points
+        dx,dy = self._get_align_vector()
+        cx = self.hflip and -1 or 1
+        cy = self.vflip and -1 or 1
+        return list(_round_rect_points(self.width,self.height,self.radius,tuple(self.roundCorners),
+                                       dx,dy,cx,cy,self.ptDensity))
 
     def _get_align_vector(self):
         if self.halign == const.CENTER:
@@ -428,14 +445,8 @@ class InsideCurve(SubscriptAttributes):
                        for point in self.points]
     
     def _calc_points(self):
-        #align=self._get_align_vector()
-        center = (-self.r0/math.tan(self.angle/2),-self.r0)
-        
-        dTheta = self.curve_angle/self.segments
-        pts = []
-        pts = [(0,0)]+[vadd((self.r0*math.sin(i*dTheta),self.r0*math.cos(i*dTheta)),center) for i in range(self.segments+1)]
-        
-        return pts
+        #geometry only depends on the shape parameters; fetch from the shared cache
+        return list(_inside_curve_points(self.r0,self.angle,self.curve_angle,self.segments))
     
     def _build_polyline(self):
         '''Build the polyline (key component)'''
@@ -571,6 +582,25 @@ class Star(SolidPline, InsideCurve):
         return dy
 
 
+@lru_cache(maxsize=256)
+def _dogbone_points(xvr_width,xvr_length,rr_width,rr_length,rr_br_gap):
+    """Pre-transform point table for DogBone, memoized: bondwire rows repeat the
+    same crossover geometry many times. The bend deltas shift the tether strips
+    only, not this outline."""
+    pts = []
+
+    pts.append((xvr_width/2, xvr_length/2))
+    pts.append((rr_width/2 + rr_br_gap, xvr_length/2))
+    pts.append((rr_width/2 + rr_br_gap, xvr_length/2 + rr_length + 2*rr_br_gap))
+
+    for pt in pts[2::-1]: # iterate from 2, 1, 0
+        pts.append((-pt[0], pt[1]))
+
+    for pt in pts[5::-1]: # iterate from 5, 4, 3, 2, 1, 0
+        pts.append((pt[0], -pt[1]))
+
+    return tuple(pts)
+
 class DogBone(SolidPline):
     name = 'DOGBONE'
     def __init__(self, insert,
@@ -592,23 +622,5 @@ class DogBone(SolidPline):
         SolidPline.__init__(self,insert,points=self._calc_corners(), **kwargs)
         
     def _calc_corners(self):
-        pts = []
-
-        pts.append((self.xvr_width/2, self.xvr_length/2))
-        pts.append((self.rr_width/2 + self.rr_br_gap, self.xvr_length/2))
-        pts.append((self.rr_width/2 + self.rr_br_gap, self.xvr_length/2 + self.rr_length + 2*self.rr_br_gap))
-
-        for pt in pts[2::-1]: # iterate from 2, 1, 0
-            pts.append((-pt[0], pt[1]))
-
-        for pt in pts[5::-1]: # iterate from 5, 4, 3, 2, 1, 0
-            pts.append((pt[0], -pt[1]))
-
-        for pt in pts[:6]: # add delta_left to account for airbridge on cpw bends
-            pt[1] + self.delta_left
-
-        for pt in pts[6:]: # add delta_left to account for airbridge on cpw bends
-            pt[1] - self.delta_right
-        
-        return pts
+        return list(_dogbone_points(self.xvr_width,self.xvr_length,self.rr_width,self.rr_length,self.rr_br_gap))
     
\ No newline at end of file
@@ -541,7 +541,13 @@ class Chip:
             struct().translatePos(vector=offsetVector, angle=angle, newDir=newDir)
         elif absolutePos is not None:
             struct().updatePos(newStart=absolutePos, angle=angle, newDir=newDir)
-        
+
+    def add_many(self,objs,structure=None,length=None,offsetVector=None,absolutePos=None,angle=0,newDir=None):
+        #add a batch of entities in order, with a single structure update at the end (see add)
+        for obj in objs[:-1]:
+            self.chipBlock.add(obj)
+        self.add(objs[-1],structure=structure,length=length,offsetVector=offsetVector,absolutePos=absolutePos,angle=angle,newDir=newDir)
+
     #return chip centered coordinates in chip space
     def centered(self,xy=(0,0)):
         return (xy[0]+self.center[0],xy[1]+self.center[1])
@@ -18,6 +18,7 @@ go in sub-libraries
 """
 
 import math
+import warnings
 import numpy as np 
 
 import maskLib.MaskLib as m
@@ -26,111 +27,172 @@ from dxfwrite import const
 from dxfwrite.vector2d import vadd ,vsub, vector2angle, distance
 from dxfwrite.algebra import rotate_2d
 
-from maskLib.Entities import SkewRect, CurveRect, RoundRect, InsideCurve, DogBone
-from maskLib.utilities import kwargStrip, curveAB
+from maskLib.Entities import SolidPline, SkewRect, CurveRect, RoundRect, InsideCurve, DogBone
+from maskLib.utilities import kwargStrip, curveAB, unitArc
 
+from bisect import bisect_left
+from collections import namedtuple
 from copy import copy
+from functools import lru_cache
+
+
+# local bindings of hot math functions (skips the module attribute lookup in inner loops)
+_sin,_cos,_sqrt = math.sin,math.cos,math.sqrt
+_SQRT3 = _sqrt(3.0)
+_DEG2RAD = math.pi/180.0
+
+def _resolve_structure(chip,structure):
+    '''Resolve a structure argument (Structure object, position tuple, or index) into a Structure'''
+    if isinstance(structure,m.Structure):
+        return structure
+    elif isinstance(structure,tuple):
+        return m.Structure(chip,structure)
+    else:
+        return chip.structure(structure)
+
+
+# opt-in rectangle template cache, enabled per-wafer with wafer.use_entity_cache = True.
+# dxfwrite rectangles render statelessly from their parameters at save time, so a cached
+# template can be shallow-copied and dropped at a new insert point
+_rect_templates = {}
+
+def _cached_rect(pos,length,height,rotation,bgcolor,stripped,valign=const.TOP):
+    key = (length,height,rotation,bgcolor,valign,tuple(sorted(stripped.items())))
+    template = _rect_templates.get(key)
+    if template is None:
+        template = dxf.rectangle((0,0),length,height,rotation=rotation,valign=valign,bgcolor=bgcolor,**stripped)
+        _rect_templates[key] = template
+    rect = copy(template)
+    rect.insert = pos
+    return rect
+
+# (cos,sin) pairs for quarter-turn multiples, indexed by (angle//90)%4
+_SC90 = ((1,0),(0,1),(-1,0),(0,-1))
+
+@lru_cache(maxsize=None)
+def _rot_quadrant(x,y,k):
+    '''Rotate (x,y) by k quarter turns; memoized since bend dimensions repeat across a wafer'''
+    c,sn = _SC90[k]
+    return (c*x - sn*y, sn*x + c*y)
+
+@lru_cache(maxsize=None)
+def _wire_bend_positions(radius,w,CCW,angle):
+    '''Local-frame inside-curve anchors and rotation offsets for a 90-degree-multiple bend'''
+    x = radius+w/2
+    y = (1 if CCW else -1)*x
+    dy = -radius if CCW else radius
+    ksign = -1 if CCW else 1
+    anchors = []
+    for i in range(angle//90):
+        px,py = _rot_quadrant(x,y,(ksign*i) % 4)
+        anchors.append((px,py+dy,ksign*i*90))
+    return anchors
+
+# exact (cos,sin) pairs for axis-aligned directions, the overwhelmingly common case
+_AXIS_TRIG = {0:(1.0,0.0),90:(0.0,1.0),180:(-1.0,0.0),270:(0.0,-1.0)}
+
+def _axis_pos(struct,dx,dy):
+    '''getPos((dx,dy)) shortcut: skip the trig entirely for axis-aligned structures'''
+    cs = _AXIS_TRIG.get(struct.direction%360)
+    if cs is None:
+        return struct.getPos((dx,dy))
+    c,sn = cs
+    x0,y0 = struct.start
+    return (x0 + (dx*c - dy*sn), y0 + (dy*c + dx*sn))
+
+def _local_to_global(struct,offsets):
+    '''Map a batch of local (x,y) offsets to global coordinates with a single trig evaluation'''
+    cs = _AXIS_TRIG.get(struct.direction%360)
+    if cs is None:
+        rad = struct.direction*_DEG2RAD
+        cs = (_cos(rad),_sin(rad))
+    c,sn = cs
+    x0,y0 = struct.start
+    return [(x0 + (dx*c - dy*sn), y0 + (dy*c + dx*sn)) for dx,dy in offsets]
+
+def _bend_offset(radius,angleRadians,CCW):
+    '''Local-frame offset of a bend endpoint (angle in radians)'''
+    return (radius*_sin(angleRadians),(1 if CCW else -1)*radius*(_cos(angleRadians)-1))
+
+def _get_defaults(struct,chip,**params):
+    '''Fill None-valued parameters from structure defaults in one pass.
+    Parameter names map to default keys by stripping trailing digits (w0 -> 'w').'''
+    defaults = struct.defaults
+    values = []
+    for name,value in params.items():
+        if value is None:
+            key = name.rstrip('0123456789')
+            value = defaults.get(key)
+            if value is None:
+                print('\x1b[33m'+key+' not defined in ',chip.chipID,'!\x1b[0m')
+        values.append(value)
+    return values
 
 # ===============================================================================
 # basic POSITIVE microstrip function definitions
 # ===============================================================================
 
 def Strip_straight(chip,structure,length,w=None,bgcolor=None,**kwargs): #note: uses CPW conventions
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+        w = struct.defaults.get('w')
+        if w is None:
+            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
+    if length == 0: #nothing to draw
+        return
     
-    chip.add(dxf.rectangle(struct().start,length,w,valign=const.MIDDLE,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=structure,length=length)
+    if getattr(chip.wafer,'use_entity_cache',False):
+        rect = _cached_rect(struct.start,length,w,struct.direction,bgcolor,kwargStrip(kwargs),valign=const.MIDDLE)
+    else:
+        rect = dxf.rectangle(struct.start,length,w,valign=const.MIDDLE,rotation=struct.direction,bgcolor=bgcolor,**kwargStrip(kwargs))
+    chip.add(rect,structure=structure,length=length)
 
 def Strip_taper(chip,structure,length=None,w0=None,w1=None,bgcolor=None,offset=(0,0),**kwargs): #note: uses CPW conventions
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
-    if w0 is None:
-        try:
-            w0 = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if w1 is None:
-        try:
-            w1 = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+    w0,w1 = _get_defaults(struct,chip,w0=w0,w1=w1)
     #if undefined, make outer angle 30 degrees
     if length is None:
-        length = math.sqrt(3)*abs(w0/2-w1/2)
+        length = _SQRT3*abs((w0-w1)*0.5)
     
-    chip.add(SkewRect(struct().start,length,w0,offset,w1,rotation=struct().direction,valign=const.MIDDLE,edgeAlign=const.MIDDLE,bgcolor=bgcolor,**kwargs),structure=structure,offsetVector=vadd((length,0),offset))
+    chip.add(SkewRect(struct.start,length,w0,offset,w1,rotation=struct.direction,valign=const.MIDDLE,edgeAlign=const.MIDDLE,bgcolor=bgcolor,**kwargs),structure=structure,offsetVector=vadd((length,0),offset))
 
 def Strip_bend(chip,structure,angle=90,CCW=True,w=None,radius=None,ptDensity=120,bgcolor=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
+        w = struct.defaults.get('w')
+        if w is None:
+            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
     if radius is None:
-        try:
-            radius = struct().defaults['radius']
-        except KeyError:
+        radius = struct.defaults.get('radius')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
         
-    while angle < 0:
-        angle = angle + 360
     angle = angle%360
-        
-    chip.add(CurveRect(struct().start,w,radius,angle=angle,ptDensity=ptDensity,ralign=const.MIDDLE,valign=const.MIDDLE,rotation=struct().direction,vflip=not CCW,bgcolor=bgcolor,**kwargs))
-    struct().updatePos(newStart=struct().getPos((radius*math.sin(math.radians(angle)),(CCW and 1 or -1)*radius*(math.cos(math.radians(angle))-1))),angle=CCW and -angle or angle)
+
+    chip.add(CurveRect(struct.start,w,radius,angle=angle,ptDensity=ptDensity,ralign=const.MIDDLE,valign=const.MIDDLE,rotation=struct.direction,vflip=not CCW,bgcolor=bgcolor,**kwargs))
+    struct.updatePos(newStart=struct.getPos(_bend_offset(radius,angle*_DEG2RAD,CCW)),angle=-angle if CCW else angle)
 
 
 def Strip_stub_open(chip,structure,flipped=False,curve_out=True,r_out=None,w=None,allow_oversize=True,length=None,bgcolor=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+        w = struct.defaults.get('w')
+        if w is None:
+            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
     if r_out is None:
-        try:
-            if allow_oversize:
-                r_out = struct().defaults['r_out']
-            else:
-                r_out = min(struct().defaults['r_out'],w/2)
-        except KeyError:
+        r_out = struct.defaults.get('r_out')
+        if r_out is None:
             print('r_out not defined in ',chip.chipID,'!\x1b[0m')
             r_out=0
+        elif not allow_oversize:
+            r_out = min(r_out,w/2)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
     
@@ -150,7 +212,7 @@ def Strip_stub_open(chip,structure,flipped=False,curve_out=True,r_out=None,w=Non
         
         if length is None: length=0
 
-        chip.add(RoundRect(struct().getPos((dx,0)),max(length,l),w,l,roundCorners=[0,curve_out,curve_out,0],hflip=flipped,valign=const.MIDDLE,rotation=struct().direction,bgcolor=bgcolor,**kwargs),structure=structure,length=max(l,length))
+        chip.add(RoundRect(struct.getPos((dx,0)),max(length,l),w,l,roundCorners=[0,curve_out,curve_out,0],hflip=flipped,valign=const.MIDDLE,rotation=struct.direction,bgcolor=bgcolor,**kwargs),structure=structure,length=max(l,length))
     else:
         if length is not None:
             if allow_oversize:
@@ -162,64 +224,47 @@ def Strip_stub_open(chip,structure,flipped=False,curve_out=True,r_out=None,w=Non
         Strip_straight(chip,structure,l,w=w,bgcolor=bgcolor,**kwargs)
 
 def Strip_stub_short(chip,structure,r_ins=None,w=None,flipped=False,extra_straight_section=False,bgcolor=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
+        w = struct.defaults.get('w')
+        if w is None:
             print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
-    if r_ins is None:
-        try:
-            r_ins = struct().defaults['r_ins']
-        except KeyError:
-            #print('r_ins not defined in ',chip.chipID,'!\x1b[0m')
-            r_ins=0
+    if r_ins is None: # quiet: fall back to square corners
+        r_ins = struct.defaults.get('r_ins',0)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
     
     if r_ins > 0:
         if extra_straight_section and not flipped:
-            Strip_straight(chip, struct(), r_ins, w=w,rotation=struct().direction,bgcolor=bgcolor,**kwargs)
-        chip.add(InsideCurve(struct().getPos((0,-w/2)),r_ins,rotation=struct().direction,hflip=flipped,bgcolor=bgcolor,**kwargs))
-        chip.add(InsideCurve(struct().getPos((0,w/2)),r_ins,rotation=struct().direction,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs))
+            Strip_straight(chip, struct, r_ins, w=w,rotation=struct.direction,bgcolor=bgcolor,**kwargs)
+        chip.add(InsideCurve(struct.getPos((0,-w/2)),r_ins,rotation=struct.direction,hflip=flipped,bgcolor=bgcolor,**kwargs))
+        chip.add(InsideCurve(struct.getPos((0,w/2)),r_ins,rotation=struct.direction,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs))
         if extra_straight_section and flipped:
-                Strip_straight(chip, struct(), r_ins, w=w,rotation=struct().direction,bgcolor=bgcolor,**kwargs)
+                Strip_straight(chip, struct, r_ins, w=w,rotation=struct.direction,bgcolor=bgcolor,**kwargs)
 
 def Strip_pad(chip,structure,length,r_out=None,w=None,bgcolor=None,**kwargs):
     '''
     Draw a pad with all rounded corners (similar to strip_stub_open + strip_straight + strip_stub_open but only one shape)
 
     '''
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+        w = struct.defaults.get('w')
+        if w is None:
+            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
     if r_out is None:
-        try:
-            r_out = min(struct().defaults['r_out'],w/2)
-        except KeyError:
+        r_out = struct.defaults.get('r_out')
+        if r_out is None:
             print('r_out not defined in ',chip.chipID,'!\x1b[0m')
             r_out=0
+        else:
+            r_out = min(r_out,w/2)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
     
     
     if r_out > 0:
-        chip.add(RoundRect(struct().getPos((0,0)),length,w,r_out,roundCorners=[1,1,1,1],valign=const.MIDDLE,rotation=struct().direction,bgcolor=bgcolor,**kwargs),structure=structure,length=length)
+        chip.add(RoundRect(struct.getPos((0,0)),length,w,r_out,roundCorners=[1,1,1,1],valign=const.MIDDLE,rotation=struct.direction,bgcolor=bgcolor,**kwargs),structure=structure,length=length)
     else:
         Strip_straight(chip,structure,length,w=w,bgcolor=bgcolor,**kwargs)
 
@@ -229,76 +274,47 @@ def Strip_pad(chip,structure,length,r_out=None,w=None,bgcolor=None,**kwargs):
 
 
 def CPW_straight(chip,structure,length,w=None,s=None,bondwires=False,bond_pitch=70,incl_end_bond=True,bgcolor=None,**kwargs): #note: uses CPW conventions
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+    w,s = _get_defaults(struct,chip,w=w,s=s)
+    if length == 0: #nothing to draw
+        return struct.getPos()
 
     if bondwires: # bond parameters patched through kwargs
         num_bonds = int(length/bond_pitch)
-        this_struct = struct().clone()
-        this_struct.shiftPos(bond_pitch)
         if not incl_end_bond: num_bonds -= 1
-        for i in range(num_bonds):
-            Airbridge(chip, this_struct, **kwargs)
-            this_struct.shiftPos(bond_pitch)
+        if num_bonds > 0:
+            # precompute all bond positions at once instead of shifting a clone per bond
+            rad = struct.direction*_DEG2RAD
+            t = np.arange(1,num_bonds+1)*bond_pitch
+            xs = struct.start[0] + t*_cos(rad)
+            ys = struct.start[1] + t*_sin(rad)
+            for x,y in zip(xs.tolist(),ys.tolist()):
+                Airbridge(chip, m.Structure(chip,start=(x,y),direction=struct.direction,defaults=struct.defaults), **kwargs)
     
-    chip.add(dxf.rectangle(struct().getPos((0,-w/2)),length,-s,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-    chip.add(dxf.rectangle(struct().getPos((0,w/2)),length,s,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=structure,length=length)
+    stripped = kwargStrip(kwargs)
+    if getattr(chip.wafer,'use_entity_cache',False):
+        rects = [_cached_rect(_axis_pos(struct,0,-w/2),length,-s,struct.direction,bgcolor,stripped),
+                 _cached_rect(_axis_pos(struct,0,w/2),length,s,struct.direction,bgcolor,stripped)]
+    else:
+        rects = [dxf.rectangle(_axis_pos(struct,0,-w/2),length,-s,rotation=struct.direction,bgcolor=bgcolor,**stripped),
+                 dxf.rectangle(_axis_pos(struct,0,w/2),length,s,rotation=struct.direction,bgcolor=bgcolor,**stripped)]
+    chip.add_many(rects,structure=structure,length=length)
 
-    return struct().getPos()
+    return struct.getPos()
         
 def CPW_taper(chip,structure,length=None,w0=None,s0=None,w1=None,s1=None,bgcolor=None,offset=(0,0),**kwargs): #note: uses CPW conventions
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
-    if w0 is None:
-        try:
-            w0 = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if s0 is None:
-        try:
-            s0 = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if w1 is None:
-        try:
-            w1 = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if s1 is None:
-        try:
-            s1 = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+    w0,s0,w1,s1 = _get_defaults(struct,chip,w0=w0,s0=s0,w1=w1,s1=s1)
     #if undefined, make outer angle 30 degrees
     if length is None:
-        length = math.sqrt(3)*abs(w0/2+s0-w1/2-s1)
+        length = _SQRT3*abs((w0-w1)*0.5+s0-s1)
     
-    chip.add(SkewRect(struct().getPos((0,-w0/2)),length,s0,(offset[0],w0/2-w1/2+offset[1]),s1,rotation=struct().direction,valign=const.TOP,edgeAlign=const.TOP,bgcolor=bgcolor,**kwargs))
-    chip.add(SkewRect(struct().getPos((0,w0/2)),length,s0,(offset[0],w1/2-w0/2+offset[1]),s1,rotation=struct().direction,valign=const.BOTTOM,edgeAlign=const.BOTTOM,bgcolor=bgcolor,**kwargs),structure=structure,offsetVector=(length+offset[0],offset[1]))
+    chip.add(SkewRect(struct.getPos((0,-w0/2)),length,s0,(offset[0],(w0-w1)*0.5+offset[1]),s1,rotation=struct.direction,valign=const.TOP,edgeAlign=const.TOP,bgcolor=bgcolor,**kwargs))
+    chip.add(SkewRect(struct.getPos((0,w0/2)),length,s0,(offset[0],(w1-w0)*0.5+offset[1]),s1,rotation=struct.direction,valign=const.BOTTOM,edgeAlign=const.BOTTOM,bgcolor=bgcolor,**kwargs),structure=structure,offsetVector=(length+offset[0],offset[1]))
 
 def CPW_rect_taper(chip, structure, w_mid, w_arm, l_top, l_bot, s=None, w=None, s_extra=0, bgcolor=None):
     """
@@ -311,25 +327,10 @@ def CPW_rect_taper(chip, structure, w_mid, w_arm, l_top, l_bot, s=None, w=None,
         w = width of taper opening 
         s_extra = extra gap width (usually for qubit's gap width)
     """
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
-    if w is None:
-        try: 
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+    w,s = _get_defaults(struct,chip,w=w,s=s)
     
     # horizontal lines diverging
     w_top = w_mid/2 - w/2 + w_arm + 2*s + s_extra
@@ -353,32 +354,15 @@ def CPW_rect_taper(chip, structure, w_mid, w_arm, l_top, l_bot, s=None, w=None,
 
 def CPW_stub_short(chip,structure,flipped=False,curve_ins=True,curve_out=True,r_out=None,w=None,s=None,length=None,bgcolor=None,**kwargs):
     allow_oversize = (curve_ins != curve_out)
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+    struct = _resolve_structure(chip,structure)
+    w,s = _get_defaults(struct,chip,w=w,s=s)
     if r_out is None:
-        try:
-            if allow_oversize:
-                r_out = struct().defaults['r_out']
-            else:
-                r_out = min(struct().defaults['r_out'],s/2)
-        except KeyError:
+        r_out = struct.defaults.get('r_out')
+        if r_out is None:
             print('r_out not defined in ',chip.chipID,'!\x1b[0m')
             r_out=0
+        elif not allow_oversize:
+            r_out = min(r_out,s/2)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
     
@@ -397,8 +381,8 @@ def CPW_stub_short(chip,structure,flipped=False,curve_ins=True,curve_out=True,r_
         else:
             l=min(s/2,r_out)
 
-        chip.add(RoundRect(struct().getPos((dx,w/2)),l,s,l,roundCorners=[0,curve_ins,curve_out,0],hflip=flipped,valign=const.BOTTOM,rotation=struct().direction,bgcolor=bgcolor,**kwargs))
-        chip.add(RoundRect(struct().getPos((dx,-w/2)),l,s,l,roundCorners=[0,curve_out,curve_ins,0],hflip=flipped,valign=const.TOP,rotation=struct().direction,bgcolor=bgcolor,**kwargs),structure=structure,length=l)
+        chip.add(RoundRect(struct.getPos((dx,w/2)),l,s,l,roundCorners=[0,curve_ins,curve_out,0],hflip=flipped,valign=const.BOTTOM,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+        chip.add(RoundRect(struct.getPos((dx,-w/2)),l,s,l,roundCorners=[0,curve_out,curve_ins,0],hflip=flipped,valign=const.TOP,rotation=struct.direction,bgcolor=bgcolor,**kwargs),structure=structure,length=l)
     else:
         if length is not None:
             if allow_oversize:
@@ -410,37 +394,17 @@ def CPW_stub_short(chip,structure,flipped=False,curve_ins=True,curve_out=True,r_
         CPW_straight(chip,structure,l,w=w,s=s,bgcolor=bgcolor,**kwargs)
         
 def CPW_stub_open(chip,structure,length=0,r_out=None,r_ins=None,w=None,s=None,flipped=False,extra_straight_section=False,bgcolor=None, polygon_overlap=False, **kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+    struct = _resolve_structure(chip,structure)
+    w,s = _get_defaults(struct,chip,w=w,s=s)
     if length==0:
         length = max(length,s)
     if r_out is None:
-        try:
-            r_out = struct().defaults['r_out']
-        except KeyError:
+        r_out = struct.defaults.get('r_out')
+        if r_out is None:
             print('\x1b[33mr_out not defined in ',chip.chipID,'!\x1b[0m')
             r_out=0
-    if r_ins is None:
-        try:
-            r_ins = struct().defaults['r_ins']
-        except KeyError:
-            #print('r_ins not defined in ',chip.chipID,'!\x1b[0m')
-            r_ins=0
+    if r_ins is None: # quiet: fall back to square corners
+        r_ins = struct.defaults.get('r_ins',0)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
     
@@ -448,73 +412,47 @@ def CPW_stub_open(chip,structure,length=0,r_out=None,r_ins=None,w=None,s=None,fl
     if flipped:
         dx = length
 
+    ents = []
     if r_ins > 0:
         if extra_straight_section and not flipped:
-            CPW_straight(chip, struct(), r_ins, w=w,s=s,rotation=struct().direction,bgcolor=bgcolor,**kwargs)
+            CPW_straight(chip, struct, r_ins, w=w,s=s,rotation=struct.direction,bgcolor=bgcolor,**kwargs)
         d_angle = 0
         if polygon_overlap: d_angle = 0.03
-        chip.add(InsideCurve(struct().getPos((dx,w/2)),r_ins, angle=90+d_angle, rotation=struct().direction - d_angle/2,hflip=flipped,bgcolor=bgcolor,**kwargs))
-        chip.add(InsideCurve(struct().getPos((dx,-w/2)),r_ins, angle=90+d_angle, rotation=struct().direction + d_angle/2,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs))
+        p_top,p_bot,p_mid = _local_to_global(struct,((dx,w/2),(dx,-w/2),(dx,0)))
+        ents.append(InsideCurve(p_top,r_ins, angle=90+d_angle, rotation=struct.direction - d_angle/2,hflip=flipped,bgcolor=bgcolor,**kwargs))
+        ents.append(InsideCurve(p_bot,r_ins, angle=90+d_angle, rotation=struct.direction + d_angle/2,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs))
+    else:
+        p_mid = struct.getPos((dx,0))
 
-    chip.add(RoundRect(struct().getPos((dx,0)),length,w+2*s,min(r_out,length),roundCorners=[0,1,1,0],hflip=flipped,valign=const.MIDDLE,rotation=struct().direction,bgcolor=bgcolor,**kwargs),structure=structure,length=length)
+    ents.append(RoundRect(p_mid,length,w+2*s,min(r_out,length),roundCorners=[0,1,1,0],hflip=flipped,valign=const.MIDDLE,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+    chip.add_many(ents,structure=structure,length=length)
     if extra_straight_section and flipped:
-        CPW_straight(chip, struct(), r_ins, w=w,s=s,rotation=struct().direction,bgcolor=bgcolor,**kwargs)
+        CPW_straight(chip, struct, r_ins, w=w,s=s,rotation=struct.direction,bgcolor=bgcolor,**kwargs)
 
 def CPW_cap(chip,structure,gap,r_ins=None,w=None,s=None,bgcolor=None,angle=90,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if r_ins is None:
-        try:
-            r_ins = struct().defaults['r_ins']
-        except KeyError:
-            #print('r_ins not defined in ',chip.chipID,'!\x1b[0m')
-            r_ins=0
+    struct = _resolve_structure(chip,structure)
+    w,s = _get_defaults(struct,chip,w=w,s=s)
+    if r_ins is None: # quiet: fall back to square corners
+        r_ins = struct.defaults.get('r_ins',0)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
+    if gap == 0: #nothing to draw
+        return
 
     if r_ins > 0:
-        chip.add(InsideCurve(struct().getPos((0,w/2)),r_ins,rotation=struct().direction + 90,vflip=True,angle=angle,bgcolor=bgcolor,**kwargs))
-        chip.add(InsideCurve(struct().getPos((0,-w/2)),r_ins,rotation=struct().direction - 90,angle=angle,bgcolor=bgcolor,**kwargs))
-        chip.add(InsideCurve(struct().getPos((gap,w/2)),r_ins,rotation=struct().direction + 90,angle=angle,bgcolor=bgcolor,**kwargs))
-        chip.add(InsideCurve(struct().getPos((gap,-w/2)),r_ins,rotation=struct().direction - 90,vflip=True,angle=angle,bgcolor=bgcolor,**kwargs))
+        pts = _local_to_global(struct,((0,w/2),(0,-w/2),(gap,w/2),(gap,-w/2)))
+        chip.add(InsideCurve(pts[0],r_ins,rotation=struct.direction + 90,vflip=True,angle=angle,bgcolor=bgcolor,**kwargs))
+        chip.add(InsideCurve(pts[1],r_ins,rotation=struct.direction - 90,angle=angle,bgcolor=bgcolor,**kwargs))
+        chip.add(InsideCurve(pts[2],r_ins,rotation=struct.direction + 90,angle=angle,bgcolor=bgcolor,**kwargs))
+        chip.add(InsideCurve(pts[3],r_ins,rotation=struct.direction - 90,vflip=True,angle=angle,bgcolor=bgcolor,**kwargs))
 
-    chip.add(dxf.rectangle(struct().start,gap,w+2*s,valign=const.MIDDLE,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=structure,length=gap)
+    chip.add(dxf.rectangle(struct.start,gap,w+2*s,valign=const.MIDDLE,rotation=struct.direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=structure,length=gap)
 
         
 def CPW_stub_round(chip,structure,w=None,s=None,round_left=True,round_right=True,flipped=False,bgcolor=None,**kwargs):
     #same as stub_open, but preserves gap width along turn (so radii are nominally defined by w, s)
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID)
+    struct = _resolve_structure(chip,structure)
+    w,s = _get_defaults(struct,chip,w=w,s=s)
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
     
@@ -522,101 +460,79 @@ def CPW_stub_round(chip,structure,w=None,s=None,round_left=True,round_right=True
     if flipped:
         dx = s+w/2
 
-    if False:#round_left and round_right:
-        chip.add(CurveRect(struct().getPos((dx,w/2)),s,w/2,angle=180,ralign=const.BOTTOM,rotation=struct().direction,hflip=flipped,bgcolor=bgcolor,**kwargs),structure=structure,length=s+w/2)
+    stripped = kwargStrip(kwargs)
+    if round_left:
+        chip.add(CurveRect(_axis_pos(struct,dx,w/2),s,w/2,angle=90,ralign=const.BOTTOM,rotation=struct.direction,hflip=flipped,bgcolor=bgcolor,**kwargs))
     else:
-        if round_left:
-            chip.add(CurveRect(struct().getPos((dx,w/2)),s,w/2,angle=90,ralign=const.BOTTOM,rotation=struct().direction,hflip=flipped,bgcolor=bgcolor,**kwargs))
-        else:
-            chip.add(dxf.rectangle(struct().getPos((0,w/2)),s+w/2,s,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-            chip.add(InsideCurve(struct().getPos((flipped and s or w/2,w/2)),w/2,rotation=struct().direction,hflip=flipped,bgcolor=bgcolor,**kwargs))
-            chip.add(dxf.rectangle(struct().getPos((s+w/2-dx,w/2)),-s,-w/2,rotation=struct().direction,halign = flipped and const.RIGHT or const.LEFT, bgcolor=bgcolor,**kwargStrip(kwargs)))
-        if round_right:
-            chip.add(CurveRect(struct().getPos((dx,-w/2)),s,w/2,angle=90,ralign=const.BOTTOM,rotation=struct().direction,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs),structure=structure,length=s+w/2)
-        else:
-            chip.add(dxf.rectangle(struct().getPos((0,-w/2)),s+w/2,-s,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-            chip.add(InsideCurve(struct().getPos((flipped and s or w/2,-w/2)),w/2,rotation=struct().direction,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs))
-            chip.add(dxf.rectangle(struct().getPos((s+w/2-dx,-w/2)),-s,w/2,rotation=struct().direction,halign = flipped and const.RIGHT or const.LEFT, bgcolor=bgcolor,**kwargStrip(kwargs)),structure=structure,length=s+w/2)
+        p0,p1,p2 = _local_to_global(struct,((0,w/2),(flipped and s or w/2,w/2),(s+w/2-dx,w/2)))
+        chip.add(dxf.rectangle(p0,s+w/2,s,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        chip.add(InsideCurve(p1,w/2,rotation=struct.direction,hflip=flipped,bgcolor=bgcolor,**kwargs))
+        chip.add(dxf.rectangle(p2,-s,-w/2,rotation=struct.direction,halign = flipped and const.RIGHT or const.LEFT, bgcolor=bgcolor,**stripped))
+    if round_right:
+        chip.add(CurveRect(_axis_pos(struct,dx,-w/2),s,w/2,angle=90,ralign=const.BOTTOM,rotation=struct.direction,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs),structure=structure,length=s+w/2)
+    else:
+        p0,p1,p2 = _local_to_global(struct,((0,-w/2),(flipped and s or w/2,-w/2),(s+w/2-dx,-w/2)))
+        chip.add(dxf.rectangle(p0,s+w/2,-s,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        chip.add(InsideCurve(p1,w/2,rotation=struct.direction,hflip=flipped,vflip=True,bgcolor=bgcolor,**kwargs))
+        chip.add(dxf.rectangle(p2,-s,w/2,rotation=struct.direction,halign = flipped and const.RIGHT or const.LEFT, bgcolor=bgcolor,**stripped),structure=structure,length=s+w/2)
     
 def CPW_bend(chip,structure,angle=90,CCW=True,w=None,s=None,radius=None,ptDensity=120,bondwires=False,incl_end_bond=True,bond_pitch=70,bgcolor=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID)
+    struct = _resolve_structure(chip,structure)
+    w,s = _get_defaults(struct,chip,w=w,s=s)
     if radius is None:
-        try:
-            radius = struct().defaults['radius']
-        except KeyError:
+        radius = struct.defaults.get('radius')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
         
-    while angle < 0:
-        angle = angle + 360
     angle = angle%360
-    angleRadians = math.radians(angle)
+    angleRadians = angle*_DEG2RAD
 
-    startstruct = struct().clone()
-        
-    chip.add(CurveRect(struct().start,s,radius,angle=angle,ptDensity=ptDensity,roffset=w/2,ralign=const.BOTTOM,rotation=struct().direction,vflip=not CCW,bgcolor=bgcolor,**kwargs))
-    chip.add(CurveRect(struct().start,s,radius,angle=angle,ptDensity=ptDensity,roffset=-w/2,ralign=const.TOP,valign=const.TOP,rotation=struct().direction,vflip=not CCW,bgcolor=bgcolor,**kwargs))
-    struct().updatePos(newStart=struct().getPos((radius*math.sin(angleRadians),(CCW and 1 or -1)*radius*(math.cos(angleRadians)-1))),angle=CCW and -angle or angle)
+    #cache the pre-bend frame: the bondwire math below needs it after updatePos
+    start0 = struct.start
+    dir0 = struct.direction
+
+    chip.add(CurveRect(start0,s,radius,angle=angle,ptDensity=ptDensity,roffset=w/2,ralign=const.BOTTOM,rotation=dir0,vflip=not CCW,bgcolor=bgcolor,**kwargs))
+    chip.add(CurveRect(start0,s,radius,angle=angle,ptDensity=ptDensity,roffset=-w/2,ralign=const.TOP,valign=const.TOP,rotation=dir0,vflip=not CCW,bgcolor=bgcolor,**kwargs))
+    struct.updatePos(newStart=struct.getPos(_bend_offset(radius,angleRadians,CCW)),angle=-angle if CCW else angle)
 
     if bondwires: # bond parameters patched through kwargs
         bond_angle_density = 8
         if 'lincolnLabs' in kwargs and kwargs['lincolnLabs']: bond_angle_density = int((2*math.pi*radius)/bond_pitch)
         clockwise = 1 if CCW else -1
-        bond_points = curveAB(startstruct.start, struct().start, clockwise=clockwise, angleDeg=angle, ptDensity=bond_angle_density)
-        if not incl_end_bond: bond_points = bond_points[:-1]
-        for i, bond_point in enumerate(bond_points[1:], start=1):
-            this_struct = m.Structure(chip, start=bond_point, direction=startstruct.direction-clockwise*i*360/bond_angle_density)
-            Airbridge(chip, this_struct, br_radius=radius, clockwise=clockwise, **kwargs)
+        segments = int(angleRadians/(2*math.pi)*bond_angle_density)
+        num_bonds = segments if incl_end_bond else segments-1
+        if num_bonds > 0:
+            # sample the arc directly in the local bend frame (see _bend_offset) and
+            # rotate the whole batch into place, skipping the chord/center construction
+            i = np.arange(1,num_bonds+1)
+            theta = i*(angleRadians/segments)
+            lx = radius*np.sin(theta)
+            ly = clockwise*radius*(np.cos(theta)-1)
+            rad = dir0*_DEG2RAD
+            c,sn = _cos(rad),_sin(rad)
+            xs = start0[0] + (lx*c - ly*sn)
+            ys = start0[1] + (ly*c + lx*sn)
+            dirs = dir0 - clockwise*i*(360/bond_angle_density)
+            for x,y,d in zip(xs.tolist(),ys.tolist(),dirs.tolist()):
+                this_struct = m.Structure(chip, start=(x,y), direction=d)
+                Airbridge(chip, this_struct, br_radius=radius, clockwise=clockwise, **kwargs)
 
 
 def CPW_tee(chip,structure,w=None,s=None,radius=None,r_ins=None,w1=None,s1=None,bgcolor=None,hflip=False,branch_off=const.CENTER, polygon_overlap=False, **kwargs):
     
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID)
+    struct = _resolve_structure(chip,structure)
+    w,s = _get_defaults(struct,chip,w=w,s=s)
     if radius is None:
-        try:
-            radius = 2*struct().defaults['s']
-        except KeyError:
+        radius = struct.defaults.get('s')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
-    if r_ins is None: #check if r_ins is defined in the defaults
-        try:
-            r_ins = struct().defaults['r_ins']
-        except KeyError: # quiet catch
-            r_ins = None   
+        radius = 2*radius
+    if r_ins is None: #check if r_ins is defined in the defaults (quiet)
+        r_ins = struct.defaults.get('r_ins')
     
     #default to left and right branches identical to original structure
     if w1 is None:
@@ -624,11 +540,14 @@ def CPW_tee(chip,structure,w=None,s=None,radius=None,r_ins=None,w1=None,s1=None,
     if s1 is None:
         s1 = s
         
-    #clone structure defaults
-    defaults1 = copy(struct().defaults)
-    #update new defaults if defined
-    defaults1.update({'w':w1})
-    defaults1.update({'s':s1})
+    #clone structure defaults, but only if the branch dimensions actually differ
+    #(Structure.__init__ copies the dict it is given, so sharing is safe)
+    if w1==w and s1==s:
+        defaults1 = struct.defaults
+    else:
+        defaults1 = dict(struct.defaults)
+        defaults1['w'] = w1
+        defaults1['s'] = s1
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
         
@@ -644,66 +563,71 @@ def CPW_tee(chip,structure,w=None,s=None,radius=None,r_ins=None,w1=None,s1=None,
     
     #figure out if tee is centered, or offset
     if branch_off == const.LEFT:
-        struct().translatePos((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),w/2+max(radius,s)),angle=-90)
+        struct.translatePos((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),w/2+max(radius,s)),angle=-90)
     elif branch_off == const.RIGHT:
-        struct().translatePos((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),-w/2-max(radius,s)),angle=90)
+        struct.translatePos((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),-w/2-max(radius,s)),angle=90)
 
-    chip.add(dxf.rectangle(struct().getPos((s_rad+w1 - 2*hflip*(s_rad+w1),0)),hflip and -s1 or s1,2*max(radius,s)+w,valign=const.MIDDLE,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+    #collect local offsets for this branch and transform them all at once
+    offs = [(s_rad+w1 - 2*hflip*(s_rad+w1),0)]
     if s==s1:
-        chip.add(CurveRect(struct().getPos((0,-w/2-s)),s,radius,hflip=hflip,ralign=const.TOP,rotation=struct().direction,bgcolor=bgcolor,**kwargs))
-        chip.add(CurveRect(struct().getPos((0,w/2+s)),s,radius,hflip=hflip,vflip=True,ralign=const.TOP,rotation=struct().direction,bgcolor=bgcolor,**kwargs))
-    else:
-        if s1>s:
-            chip.add(dxf.rectangle(struct().getPos((0,-w/2)),hflip and s-s1 or s1-s,-s,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-            chip.add(dxf.rectangle(struct().getPos((0,w/2)),hflip and s-s1 or s1-s,s,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-            chip.add(CurveRect(struct().getPos((hflip and s-s1 or s1-s,-w/2-s)),radius,radius,hflip=hflip,ralign=const.TOP,rotation=struct().direction,bgcolor=bgcolor,**kwargs))
-            chip.add(CurveRect(struct().getPos((hflip and s-s1 or s1-s,w/2+s)),radius,radius,hflip=hflip,vflip=True,ralign=const.TOP,rotation=struct().direction,bgcolor=bgcolor,**kwargs))
-        else:#s1<s
-            chip.add(CurveRect(struct().getPos((0,-w/2-radius)),radius,radius,hflip=hflip,ralign=const.TOP,rotation=struct().direction,bgcolor=bgcolor,**kwargs))
-            chip.add(CurveRect(struct().getPos((0,w/2+radius)),radius,radius,hflip=hflip,vflip=True,ralign=const.TOP,rotation=struct().direction,bgcolor=bgcolor,**kwargs))
-            chip.add(dxf.rectangle(struct().getPos((0,-w/2-radius)),hflip and -radius or radius,-(s-s1),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-            chip.add(dxf.rectangle(struct().getPos((0,w/2+radius)),hflip and -radius or radius,(s-s1),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-    if radius <= min(s,s1) and r_ins > 0:
+        offs += [(0,-w/2-s),(0,w/2+s)]
+    elif s1>s:
+        offs += [(0,-w/2),(0,w/2),(hflip and s-s1 or s1-s,-w/2-s),(hflip and s-s1 or s1-s,w/2+s)]
+    else:#s1<s
+        offs += [(0,-w/2-radius),(0,w/2+radius)]
+    square_ins = radius <= min(s,s1) and r_ins > 0
+    if square_ins:
+        offs += [(0,w/2+s),(0,-w/2-s)]
+    pts = _local_to_global(struct,offs)
+
+    stripped = kwargStrip(kwargs)
+    ents = [dxf.rectangle(pts[0],hflip and -s1 or s1,2*max(radius,s)+w,valign=const.MIDDLE,rotation=struct.direction,bgcolor=bgcolor,**stripped)]
+    if s==s1:
+        ents.append(CurveRect(pts[1],s,radius,hflip=hflip,ralign=const.TOP,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+        ents.append(CurveRect(pts[2],s,radius,hflip=hflip,vflip=True,ralign=const.TOP,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+    elif s1>s:
+        ents.append(dxf.rectangle(pts[1],hflip and s-s1 or s1-s,-s,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        ents.append(dxf.rectangle(pts[2],hflip and s-s1 or s1-s,s,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        ents.append(CurveRect(pts[3],radius,radius,hflip=hflip,ralign=const.TOP,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+        ents.append(CurveRect(pts[4],radius,radius,hflip=hflip,vflip=True,ralign=const.TOP,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+    else:#s1<s
+        ents.append(CurveRect(pts[1],radius,radius,hflip=hflip,ralign=const.TOP,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+        ents.append(CurveRect(pts[2],radius,radius,hflip=hflip,vflip=True,ralign=const.TOP,rotation=struct.direction,bgcolor=bgcolor,**kwargs))
+        ents.append(dxf.rectangle(pts[1],hflip and -radius or radius,-(s-s1),rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        ents.append(dxf.rectangle(pts[2],hflip and -radius or radius,(s-s1),rotation=struct.direction,bgcolor=bgcolor,**stripped))
+    if square_ins:
         #inside edges are square
         d_angle = 0
         if polygon_overlap: d_angle = 0.03
-        chip.add(InsideCurve(struct().getPos((0,w/2+s)),r_ins,hflip=hflip,vflip=True,ralign=const.TOP, angle=90+d_angle, rotation=struct().direction + d_angle/2, bgcolor=bgcolor,**kwargs))
-        chip.add(InsideCurve(struct().getPos((0,-w/2-s)),r_ins,hflip=hflip,vflip=False,ralign=const.TOP, angle=90+d_angle, rotation=struct().direction - d_angle/2, bgcolor=bgcolor,**kwargs))
+        ents.append(InsideCurve(pts[-2],r_ins,hflip=hflip,vflip=True,ralign=const.TOP, angle=90+d_angle, rotation=struct.direction + d_angle/2, bgcolor=bgcolor,**kwargs))
+        ents.append(InsideCurve(pts[-1],r_ins,hflip=hflip,vflip=False,ralign=const.TOP, angle=90+d_angle, rotation=struct.direction - d_angle/2, bgcolor=bgcolor,**kwargs))
+    chip.add_many(ents)
     
     
     if branch_off == const.CENTER:  
-        s_l = struct().cloneAlong((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),w/2+max(radius,s)),newDirection=90,defaults=defaults1)
-        s_r = struct().cloneAlong((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),-w/2-max(radius,s)),newDirection=-90,defaults=defaults1)
+        s_l = struct.cloneAlong((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),w/2+max(radius,s)),newDirection=90,defaults=defaults1)
+        s_r = struct.cloneAlong((s_rad+w1/2 - 2*hflip*(s_rad+w1/2),-w/2-max(radius,s)),newDirection=-90,defaults=defaults1)
     
         return s_l,s_r
     elif branch_off == const.LEFT:
-        s_l = struct().cloneAlong((0,0),newDirection=180)
-        struct().translatePos((w/2+max(radius,s),s_rad+w1/2 - 2*hflip*(s_rad+w1/2)),angle=90)
+        s_l = struct.cloneAlong((0,0),newDirection=180)
+        struct.translatePos((w/2+max(radius,s),s_rad+w1/2 - 2*hflip*(s_rad+w1/2)),angle=90)
         return s_l
     elif branch_off == const.RIGHT:
-        s_r = struct().cloneAlong((0,0),newDirection=180)
-        struct().translatePos((w/2+max(radius,s),-s_rad-w1/2 + 2*hflip*(s_rad+w1/2)),angle=-90)
+        s_r = struct.cloneAlong((0,0),newDirection=180)
+        struct.translatePos((w/2+max(radius,s),-s_rad-w1/2 + 2*hflip*(s_rad+w1/2)),angle=-90)
         return s_r
 
 # ===============================================================================
 # basic NEGATIVE TwoPinCPW function definitions
 # ===============================================================================
 
-def TwoPinCPW_straight(chip,structure,length,w=None,s_ins=None,s_out=None,Width=None,s=None,bgcolor=None,**kwargs): #note: uses CPW conventions
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if bgcolor is None:
-        bgcolor = chip.wafer.bg()
+def _twoPinCPW_dims(struct,chip,w,s_ins,s_out,Width,s):
+    '''Shared parameter triage for the TwoPinCPW functions; returns (w,s_ins,s_out)'''
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+        w = struct.defaults.get('w')
+        if w is None:
+            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
     if s is not None:
         #s overridden somewhere above
         if s_ins is None:
@@ -711,23 +635,62 @@ def TwoPinCPW_straight(chip,structure,length,w=None,s_ins=None,s_out=None,Width=
         if s_out is None:
             s_out = s
     if s_ins is None:
-        try:
-            s_ins = struct().defaults['s']
-        except KeyError:
+        s_ins = struct.defaults.get('s')
+        if s_ins is None:
             print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
     if s_out is None:
         if Width is not None:
             s_out = Width - w - s_ins/2
         else:
-            try:
-                s_out = struct().defaults['s']
-            except KeyError:
+            s_out = struct.defaults.get('s')
+            if s_out is None:
                 print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    
-    
-    chip.add(dxf.rectangle(struct().getPos((0,-s_ins/2-w)),length,-s_out,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-    chip.add(dxf.rectangle(struct().getPos((0,-s_ins/2)),length,s_ins,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-    chip.add(dxf.rectangle(struct().getPos((0,s_ins/2+w)),length,s_out,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=structure,length=length)
+    return w,s_ins,s_out
+
+def TwoPinCPW_straight(chip,structure,length,w=None,s_ins=None,s_out=None,Width=None,s=None,bgcolor=None,**kwargs): #note: uses CPW conventions
+    struct = _resolve_structure(chip,structure)
+    if bgcolor is None:
+        bgcolor = chip.wafer.bg()
+    w,s_ins,s_out = _twoPinCPW_dims(struct,chip,w,s_ins,s_out,Width,s)
+
+    stripped = kwargStrip(kwargs)
+    half = s_ins*0.5
+    top = half + w
+    p0,p1,p2 = _local_to_global(struct,((0,-top),(0,-half),(0,top)))
+    if getattr(chip.wafer,'use_entity_cache',False):
+        ents = [_cached_rect(p0,length,-s_out,struct.direction,bgcolor,stripped),
+                _cached_rect(p1,length,s_ins,struct.direction,bgcolor,stripped),
+                _cached_rect(p2,length,s_out,struct.direction,bgcolor,stripped)]
+    else:
+        ents = [dxf.rectangle(p0,length,-s_out,rotation=struct.direction,bgcolor=bgcolor,**stripped),
+                dxf.rectangle(p1,length,s_ins,rotation=struct.direction,bgcolor=bgcolor,**stripped),
+                dxf.rectangle(p2,length,s_out,rotation=struct.direction,bgcolor=bgcolor,**stripped)]
+    chip.add_many(ents,structure=structure,length=length)
+
+def _TwoPinCPW_straight_batch(chip,structure,lengths,w=None,s_ins=None,s_out=None,Width=None,s=None,bgcolor=None,**kwargs):
+    '''Emit several collinear TwoPinCPW straight segments in one pass.
+    Defaults triage, trig and kwarg filtering are shared across the batch; the
+    structure advances by sum(lengths) exactly as repeated scalar calls would.'''
+    struct = _resolve_structure(chip,structure)
+    if bgcolor is None:
+        bgcolor = chip.wafer.bg()
+    w,s_ins,s_out = _twoPinCPW_dims(struct,chip,w,s_ins,s_out,Width,s)
+
+    stripped = kwargStrip(kwargs)
+    rad = struct.direction*_DEG2RAD
+    c,sn = _cos(rad),_sin(rad)
+    x0,y0 = struct.start
+    lengths = [float(l) for l in lengths]
+    half = s_ins*0.5
+    top = half + w
+    ents = []
+    t = 0.0
+    for length in lengths:
+        for dy,hgt in ((-top,-s_out),(-half,s_ins),(top,s_out)):
+            ents.append(dxf.rectangle((x0 + (t*c - dy*sn), y0 + (dy*c + t*sn)),length,hgt,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        t += length
+    if ents:
+        chip.add_many(ents,structure=structure,length=t)
 
 # ===============================================================================
 #  NEGATIVE wire/stripline function definitions
@@ -737,45 +700,42 @@ def Wire_bend(chip,structure,angle=90,CCW=True,w=None,radius=None,bgcolor=None,*
     #only defined for 90 degree bends
     if angle%90 != 0:
         return
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
+        w = struct.defaults.get('w')
+        if w is None:
+            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
     if radius is None:
-        try:
-            radius = struct().defaults['radius']
-        except KeyError:
+        radius = struct.defaults.get('radius')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
         
-    while angle < 0:
-        angle = angle + 360
     angle = angle%360
-        
-    if radius-w/2 > 0:
-        chip.add(CurveRect(struct().start,radius-w/2,radius,angle=angle,roffset=-w/2,ralign=const.TOP,valign=const.TOP,rotation=struct().direction,vflip=not CCW,bgcolor=bgcolor,**kwargs))
-    for i in range(angle//90):
-        chip.add(InsideCurve(struct().getPos(vadd(rotate_2d((radius+w/2,(CCW and 1 or -1)*(radius+w/2)),(CCW and -1 or 1)*math.radians(i*90)),(0,CCW and -radius or radius))),radius+w/2,rotation=struct().direction+(CCW and -1 or 1)*i*90,bgcolor=bgcolor,vflip=not CCW,**kwargs))
-    struct().updatePos(newStart=struct().getPos((radius*math.sin(math.radians(angle)),(CCW and 1 or -1)*radius*(math.cos(math.radians(angle))-1))),angle=CCW and -angle or angle)
+    sgn = 1 if CCW else -1
+    vflip = not CCW
+    rw_in = radius - w*0.5
+    rw_out = radius + w*0.5
+
+    #skip the outer curve entirely when radius <= w/2 (within fp noise): the curve has zero height and would only add degenerate geometry
+    if rw_in > 1e-12:
+        chip.add(CurveRect(struct.start,rw_in,radius,angle=angle,roffset=-w/2,ralign=const.TOP,valign=const.TOP,rotation=struct.direction,vflip=vflip,bgcolor=bgcolor,**kwargs))
+    getPos = struct.getPos
+    direction = struct.direction
+    for px,py,rot in _wire_bend_positions(radius,w,CCW,int(angle)):
+        chip.add(InsideCurve(getPos((px,py)),rw_out,rotation=direction+rot,bgcolor=bgcolor,vflip=vflip,**kwargs))
+    c,sn = _SC90[int(angle//90) % 4]
+    struct.updatePos(newStart=getPos((radius*sn,sgn*radius*(c-1))),angle=-sgn*angle)
 
 # ===============================================================================
 # composite CPW function definitions
 # ===============================================================================
 def CPW_pad(chip,struct,l_pad=0,l_gap=0,padw=300,pads=50,l_lead=None,w=None,s=None,r_ins=None,r_out=None,bgcolor=None,**kwargs):
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
+        w = _resolve_structure(chip,struct).defaults.get('w')
+        if w is None:
             w=0
             print('\x1b[33mw not defined in ',chip.chipID)
     CPW_stub_open(chip,struct,length=max(l_gap,pads),r_out=r_out,r_ins=r_ins,w=padw,s=pads,flipped=True,**kwargs)
@@ -808,29 +768,24 @@ def CPW_launcher_MIT_LL(chip,struct,l_taper=None,l_pad=0,l_gap=0,w=None,s=None,r
     CPW_taper(chip,struct,length=l_taper,w0=w0_taper,w1 = w1_taper, s0=substr_w,**kwargs)
 
 def CPW_taper_cap(chip,structure,gap,width,l_straight=0,l_taper=None,s1=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if s1 is None:
-        try:
-            s = struct().defaults['s']
-            w = struct().defaults['w']
-            s1 = width*s/w
-        except KeyError:
+        s = struct.defaults.get('s')
+        w = struct.defaults.get('w')
+        if s is None or w is None:
             print('\x1b[33mw not defined in ',chip.chipID)
             print('\x1b[33ms not defined in ',chip.chipID)
+        else:
+            s1 = width*s/w
     if l_taper is None:
         l_taper = 3*width
     if l_straight<=0:
-        try:
-            tap_angle = math.degrees(math.atan(2*l_taper/(width-struct().defaults['w'])))
-        except KeyError:
+        w0 = struct.defaults.get('w')
+        if w0 is None:
             print('\x1b[33mw not defined in ',chip.chipID)
             tap_angle = 90
+        else:
+            tap_angle = math.degrees(math.atan(2*l_taper/(width-w0)))
     else:
         tap_angle = 90
         
@@ -843,31 +798,26 @@ def CPW_taper_cap(chip,structure,gap,width,l_straight=0,l_taper=None,s1=None,**k
     CPW_taper(chip,structure,length=l_taper,w0=width,s0=s1,**kwargs)
     
 def CPW_directTo(chip,from_structure,to_structure,to_flipped=True,w=None,s=None,radius=None,CW1_override=None,CW2_override=None,flip_angle=False,debug=False,**kwargs):
-    def struct1():
-        if isinstance(from_structure,m.Structure):
-            return from_structure
-        else:
-            return chip.structure(from_structure)
+    struct1 = from_structure if isinstance(from_structure,m.Structure) else chip.structure(from_structure)
     if radius is None:
-        try:
-            radius = struct1().defaults['radius']
-        except KeyError:
+        radius = struct1.defaults.get('radius')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
     #struct2 is only a local copy
-    struct2 = isinstance(to_structure,m.Structure) and to_structure or chip.structure(to_structure)
+    struct2 = to_structure if isinstance(to_structure,m.Structure) else chip.structure(to_structure)
     if to_flipped:
         struct2.direction=(struct2.direction+180.)%360
     
-    CW1 = vector2angle(struct1().getGlobalPos(struct2.start)) < 0
-    CW2 = vector2angle(struct2.getGlobalPos(struct1().start)) < 0
+    CW1 = vector2angle(struct1.getGlobalPos(struct2.start)) < 0
+    CW2 = vector2angle(struct2.getGlobalPos(struct1.start)) < 0
 
-    target1 = struct1().getPos((0,CW1 and -2*radius or 2*radius))
+    target1 = struct1.getPos((0,CW1 and -2*radius or 2*radius))
     target2 = struct2.getPos((0,CW2 and -2*radius or 2*radius))
     
     #reevaluate based on center positions
     
-    CW1 = vector2angle(struct1().getGlobalPos(target2)) < 0
+    CW1 = vector2angle(struct1.getGlobalPos(target2)) < 0
     CW2 = vector2angle(struct2.getGlobalPos(target1)) < 0
     
     if CW1_override is not None:
@@ -875,83 +825,122 @@ def CPW_directTo(chip,from_structure,to_structure,to_flipped=True,w=None,s=None,
     if CW2_override is not None:
         CW2 = CW2_override
 
-    center1 = struct1().getPos((0,CW1 and -radius or radius))
+    center1 = struct1.getPos((0,CW1 and -radius or radius))
     center2 = struct2.getPos((0,CW2 and -radius or radius))
     
     if debug:
-        chip.add(dxf.line(struct1().getPos((-3000,0)),struct1().getPos((3000,0)),layer='FRAME'))
+        chip.add(dxf.line(struct1.getPos((-3000,0)),struct1.getPos((3000,0)),layer='FRAME'))
         chip.add(dxf.line(struct2.getPos((-3000,0)),struct2.getPos((3000,0)),layer='FRAME'))
         chip.add(dxf.circle(center=center1,radius=radius,layer='FRAME'))
         chip.add(dxf.circle(center=center2,radius=radius,layer='FRAME'))
     
-    correction_angle=math.asin(abs(2*radius*(CW1 - CW2)/distance(center2,center1)))
-    angle1 = abs(struct1().direction - math.degrees(vector2angle(vsub(center2,center1)))) + math.degrees(correction_angle)
+    #compute the center-to-center vector once; dist and base_angle feed both bends and the straight
+    dx = center2[0]-center1[0]
+    dy = center2[1]-center1[1]
+    dist = math.hypot(dx,dy)
+    #work in radians throughout; convert to degrees only at the CPW_bend calls
+    base_angle = math.atan2(dy,dx)
+    correction_angle=math.asin(abs(2*radius*(CW1 - CW2)/dist))
+    angle1 = abs(math.radians(struct1.direction) - base_angle) + correction_angle
     if flip_angle:
-        angle1 = 360-abs(struct1().direction - math.degrees(vector2angle(vsub(center2,center1)))) + math.degrees(correction_angle)
-    
+        angle1 = 2*math.pi-abs(math.radians(struct1.direction) - base_angle) + correction_angle
+
     if debug:
-        print(CW1,CW2,angle1,math.degrees(correction_angle))
-    
-    if angle1 > 270:
+        print(CW1,CW2,math.degrees(angle1),math.degrees(correction_angle))
+
+    if angle1 > 1.5*math.pi:
         if debug:
             print('adjusting to shorter angle')
-        angle1 = min(angle1,abs(360-angle1))
+        angle1 = min(angle1,abs(2*math.pi-angle1))
     '''
     if CW1 - CW2 == 0 and abs(angle1)>100:
-        if abs((struct1().getGlobalPos(struct2.start))[1]) < 2*radius:
+        if abs((struct1.getGlobalPos(struct2.start))[1]) < 2*radius:
             print('adjusting angle')
             angle1 = angle1 + math.degrees(math.asin(abs(2*radius/distance(center2,center1))))
             '''
-    CPW_bend(chip,from_structure,angle=angle1,w=w,s=s,radius=radius, CCW=CW1,**kwargs)
-    CPW_straight(chip,from_structure,distance(center2,center1)*math.cos(correction_angle),w=w,s=s,**kwargs)
+    CPW_bend(chip,from_structure,angle=math.degrees(angle1),w=w,s=s,radius=radius, CCW=CW1,**kwargs)
+    CPW_straight(chip,from_structure,dist*math.cos(correction_angle),w=w,s=s,**kwargs)
     
-    angle2 = abs(struct1().direction-struct2.direction)
+    angle2 = abs(struct1.direction-struct2.direction)
     if angle2 > 270:
         angle2 = min(angle2,abs(360-angle2))
     CPW_bend(chip,from_structure,angle=angle2,w=w,s=s,radius=radius,CCW=CW2,**kwargs)
 
-#Various wiggles (meander) definitions 
+#Various wiggles (meander) definitions
 
-def wiggle_calc(chip,structure,length=None,nTurns=None,maxWidth=None,Width=None,start_bend = True,stop_bend=True,w=None,s=None,radius=None,debug=False,**kwargs):
-    #figure out 
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
+def _wiggle_ops(nTurns,h,radius,CCW,start_bend,stop_bend):
+    '''Straight/bend op sequence of one meander, mirroring the emission order of the wiggle functions.
+    Returns ('s',length) and ('b',angleDeg,CCW) tuples; all bends share the one radius.'''
+    ops = []
+    seg = h + radius + max(0,h-radius)
+    if start_bend:
+        ops.append(('b',90,CCW))
+        if h > radius:
+            ops.append(('s',h-radius))
+    else:
+        ops.append(('s',h))
+    ops.append(('b',180,not CCW))
+    ops.append(('s',seg))
+    ops.append(('b',180,CCW))
+    for n in range(nTurns-1):
+        ops.append(('s',seg))
+        ops.append(('b',180,not CCW))
+        ops.append(('s',seg))
+        ops.append(('b',180,CCW))
+    if h > radius:
+        ops.append(('s',h-radius))
+    if stop_bend:
+        ops.append(('b',90,not CCW))
+    else:
+        ops.append(('s',radius))
+    return ops
+
+def _meander_boundaries(start,direction,ops,radius,offsets,ptDensity=120):
+    '''Trace an op sequence (see _wiggle_ops) from (start,direction) and return the parallel
+    boundary polyline at each signed local offset (positive = local +y), plus the end frame.'''
+    x,y = start
+    thdeg = direction
+    th = thdeg*_DEG2RAD
+    c,sn = _cos(th),_sin(th)
+    bnds = [[(x - d*sn, y + d*c)] for d in offsets]
+    for op in ops:
+        if op[0] == 's':
+            x += op[1]*c
+            y += op[1]*sn
+            for d,bnd in zip(offsets,bnds):
+                bnd.append((x - d*sn, y + d*c))
         else:
-            return chip.structure(structure)
-    if radius is None:
-        try:
-            radius = struct().defaults['radius']
-        except KeyError:
-            print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
-            return
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            s = 0
-    #prevent dumb entries
-    if nTurns is None:
-        nTurns = 1
-    elif nTurns < 1:
-        nTurns = 1
-    
-    #debug
-    if debug:
-        print('w=',w,' s=',s,' nTurns=',nTurns,' length=',length,' Width=',Width,' maxWidth=',maxWidth)
-    
+            #bend: CCW=True curves toward local -y and lowers direction (see _bend_offset)
+            a = op[1]*_DEG2RAD
+            sgn = 1 if op[2] else -1
+            cx = x + sgn*radius*sn
+            cy = y - sgn*radius*c
+            segments = max(int(op[1]/360*ptDensity),1)
+            #rotate the cached unit-arc table to the bend's start angle instead of resampling trig
+            cos_b,sin_b = unitArc(op[1],segments)
+            phi0 = th + sgn*(math.pi/2)
+            c0,s0 = _cos(phi0),_sin(phi0)
+            cph = c0*cos_b[1:] + sgn*s0*sin_b[1:]
+            sph = s0*cos_b[1:] - sgn*c0*sin_b[1:]
+            for d,bnd in zip(offsets,bnds):
+                rho = radius + sgn*d
+                bnd.extend(zip((cx + rho*cph).tolist(),(cy + rho*sph).tolist()))
+            thdeg -= sgn*op[1]
+            th = thdeg*_DEG2RAD
+            c,sn = _cos(th),_sin(th)
+            x = cx - sgn*radius*sn
+            y = cy + sgn*radius*c
+    return bnds,(x,y),thdeg
+
+@lru_cache(maxsize=4096)
+def _wiggle_calc_core(length,nTurns,maxWidth,Width,start_bend,stop_bend,w,s,radius):
+    '''Pure numeric body of wiggle_calc; memoized since the same meander geometry repeats across a chip'''
     #is length constrained?
     if length is not None:
-        if nTurns is None:
-            nTurns = 1
-        h = (length - nTurns*2*math.pi*radius - (start_bend+stop_bend)*(math.pi/2-1)*radius)/(4*nTurns)
+        #loop-invariant pieces of the h formula
+        two_pi_r = 2*math.pi*radius
+        edge = (start_bend+stop_bend)*(math.pi/2-1)*radius
+        h = (length - nTurns*two_pi_r - edge)/(4*nTurns)
 
         #is width constrained?
         if Width is not None or maxWidth is not None:
@@ -963,26 +952,53 @@ def wiggle_calc(chip,structure,length=None,nTurns=None,maxWidth=None,Width=None,
                     maxWidth = min(maxWidth,Width)
             else:
                 maxWidth = Width
+            #closed-form lower bound on nTurns (h is decreasing in nTurns), then verify against the exact condition
+            denom = 4*(maxWidth-radius-w/2-s/2) + two_pi_r
+            if denom > 0:
+                n0 = int(math.ceil((length - edge)/denom)) - 2
+                if n0 > nTurns:
+                    nTurns = n0
+                    h = (length - nTurns*two_pi_r - edge)/(4*nTurns)
             while h+radius+w/2+s/2>maxWidth:
                 nTurns = nTurns+1
-                h = (length - nTurns*2*math.pi*radius - (start_bend+stop_bend)*(math.pi/2-1)*radius)/(4*nTurns)
+                h = (length - nTurns*two_pi_r - edge)/(4*nTurns)
     else: #length is not contrained
         h= maxWidth-radius-w/2-s
     h = max(h,radius)
+    return nTurns,h,maxWidth,Width
+
+def wiggle_calc(chip,structure,length=None,nTurns=None,maxWidth=None,Width=None,start_bend = True,stop_bend=True,w=None,s=None,radius=None,debug=False,**kwargs):
+    #figure out
+    struct = _resolve_structure(chip,structure)
+    if radius is None:
+        radius = struct.defaults.get('radius')
+        if radius is None:
+            print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
+            return
+    if w is None:
+        w = struct.defaults.get('w')
+        if w is None:
+            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
+    if s is None:
+        s = struct.defaults.get('s',0)
+    #prevent dumb entries
+    if nTurns is None:
+        nTurns = 1
+    elif nTurns < 1:
+        nTurns = 1
+
+    #debug
+    if debug:
+        print('w=',w,' s=',s,' nTurns=',nTurns,' length=',length,' Width=',Width,' maxWidth=',maxWidth)
+
+    nTurns,h,maxWidth,Width = _wiggle_calc_core(length,nTurns,maxWidth,Width,bool(start_bend),bool(stop_bend),w,s,radius)
     return {'nTurns':nTurns,'h':h,'length':length,'maxWidth':maxWidth,'Width':Width}
 
-def CPW_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,start_bend = True,stop_bend=True,w=None,s=None,radius=None,bgcolor=None,debug=False,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+def CPW_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,start_bend = True,stop_bend=True,w=None,s=None,radius=None,bgcolor=None,debug=False,fused=False,**kwargs):
+    struct = _resolve_structure(chip,structure)
     if radius is None:
-        try:
-            radius = struct().defaults['radius']
-        except KeyError:
+        radius = struct.defaults.get('radius')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
     
@@ -992,8 +1008,22 @@ def CPW_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,st
         raise ValueError('not enough params specified for CPW_wiggles!')
         
     if debug:
-        chip.add(dxf.rectangle(struct().start,(nTurns*4 + start_bend + stop_bend)*radius,2*h,valign=const.MIDDLE,rotation=struct().direction,layer='FRAME'))
-        chip.add(dxf.rectangle(struct().start,(nTurns*4 + start_bend + stop_bend)*radius,2*maxWidth,valign=const.MIDDLE,rotation=struct().direction,layer='FRAME'))
+        chip.add(dxf.rectangle(struct.start,(nTurns*4 + start_bend + stop_bend)*radius,2*h,valign=const.MIDDLE,rotation=struct.direction,layer='FRAME'))
+        chip.add(dxf.rectangle(struct.start,(nTurns*4 + start_bend + stop_bend)*radius,2*maxWidth,valign=const.MIDDLE,rotation=struct.direction,layer='FRAME'))
+    if fused:
+        #emit each gap strip of the whole meander as one quad-filled polyline instead of per-segment entities
+        w,s = _get_defaults(struct,chip,w=w,s=s)
+        if bgcolor is None:
+            bgcolor = chip.wafer.bg()
+        ops = _wiggle_ops(nTurns,h,radius,CCW,start_bend,stop_bend)
+        bnds,end,endDir = _meander_boundaries(struct.start,struct.direction,ops,radius,(w/2,w/2+s,-w/2,-w/2-s))
+        stripped = kwargStrip(kwargs)
+        chip.add_many([SolidPline((0,0),points=bnds[0]+bnds[1][::-1],bgcolor=bgcolor,solidFillQuads=True,**stripped),
+                       SolidPline((0,0),points=bnds[2]+bnds[3][::-1],bgcolor=bgcolor,solidFillQuads=True,**stripped)],
+                      structure=structure,absolutePos=end,newDir=endDir)
+        return
+    #collinear straight pairs are emitted as one segment (h is clamped so h-radius >= 0)
+    seg = h + radius + max(0,h-radius)
     if start_bend:
         CPW_bend(chip,structure,angle=90,CCW=CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
         if h > radius:
@@ -1001,26 +1031,32 @@ def CPW_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,st
     else:
         CPW_straight(chip,structure,h,w=w,s=s,bgcolor=bgcolor,**kwargs)
     CPW_bend(chip,structure,angle=180,CCW=not CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
-    CPW_straight(chip,structure,h+radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
-    if h > radius:
-        CPW_straight(chip,structure,h-radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
+    CPW_straight(chip,structure,seg,w=w,s=s,bgcolor=bgcolor,**kwargs)
     CPW_bend(chip,structure,angle=180,CCW=CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
-    if h > radius:
-        CPW_straight(chip,structure,h-radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
     for n in range(nTurns-1):
-        CPW_straight(chip,structure,h+radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
+        CPW_straight(chip,structure,seg,w=w,s=s,bgcolor=bgcolor,**kwargs)
         CPW_bend(chip,structure,angle=180,CCW=not CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
-        CPW_straight(chip,structure,h+radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
-        if h > radius:
-            CPW_straight(chip,structure,h-radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
+        CPW_straight(chip,structure,seg,w=w,s=s,bgcolor=bgcolor,**kwargs)
         CPW_bend(chip,structure,angle=180,CCW=CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
-        if h > radius:
-            CPW_straight(chip,structure,h-radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
+    if h > radius:
+        CPW_straight(chip,structure,h-radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
     if stop_bend:
         CPW_bend(chip,structure,angle=90,CCW=not CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
     else:
         CPW_straight(chip,structure,radius,w=w,s=s,bgcolor=bgcolor,**kwargs)
 
+@lru_cache(maxsize=None)
+def _bus_ops(nTurns,straight_seg,CCW):
+    '''Cached straight/bend op sequence for CPW_bus (see _wiggle_ops); bus geometry repeats across a chip'''
+    ops = [('s',straight_seg/2),('b',180,CCW)]
+    for n in range(nTurns-1):
+        ops.append(('s',straight_seg))
+        ops.append(('b',180,not CCW))
+        ops.append(('s',straight_seg))
+        ops.append(('b',180,CCW))
+    ops.append(('s',straight_seg/2))
+    return tuple(ops)
+
 def CPW_bus(chip,structure,length=None,nTurns=None,CCW=True,w=None,s=None,radius=None,bgcolor=None,**kwargs):
     """
     Draws the bus resonator's wiggle part.
@@ -1039,36 +1075,23 @@ def CPW_bus(chip,structure,length=None,nTurns=None,CCW=True,w=None,s=None,radius
             return
 
     num_180_turns = 2 * nTurns - 1
-    total_turn_length = np.pi * radius * num_180_turns
+    pi_r = np.pi * radius
+    total_turn_length = pi_r * num_180_turns
     length_left = length - total_turn_length
 
     straight_seg = length_left/num_180_turns
 
-    # first bend
-    CPW_straight(chip,structure,straight_seg/2,w=w,s=s,bgcolor=bgcolor,**kwargs)
-    CPW_bend(chip,structure,angle=180,CCW=CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
-
-    for n in range(nTurns-1):
-        CPW_straight(chip,structure,straight_seg,w=w,s=s,bgcolor=bgcolor,**kwargs)
-        CPW_bend(chip,structure,angle=180,CCW=not CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
-        CPW_straight(chip,structure,straight_seg,w=w,s=s,bgcolor=bgcolor,**kwargs)
-        CPW_bend(chip,structure,angle=180,CCW=CCW,w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
-
-    # last segment
-    CPW_straight(chip,structure,straight_seg/2,w=w,s=s,bgcolor=bgcolor,**kwargs)
-
-def Strip_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,start_bend = True,stop_bend=True,w=None,radius=None,bgcolor=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
+    for op in _bus_ops(nTurns,straight_seg,CCW):
+        if op[0] == 's':
+            CPW_straight(chip,structure,op[1],w=w,s=s,bgcolor=bgcolor,**kwargs)
         else:
-            return chip.structure(structure)
+            CPW_bend(chip,structure,angle=op[1],CCW=op[2],w=w,s=s,radius=radius,bgcolor=bgcolor,**kwargs)
+
+def Strip_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,start_bend = True,stop_bend=True,w=None,radius=None,bgcolor=None,fused=False,**kwargs):
+    struct = _resolve_structure(chip,structure)
     if radius is None:
-        try:
-            radius = struct().defaults['radius']
-        except KeyError:
+        radius = struct.defaults.get('radius')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
     
@@ -1078,6 +1101,21 @@ def Strip_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,
         print('not enough params specified for Microstrip_wiggles!')
         return
 
+    if fused:
+        #emit the whole meandered strip as one quad-filled polyline instead of per-segment entities
+        if w is None:
+            w = struct.defaults.get('w')
+            if w is None:
+                print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
+        if bgcolor is None:
+            bgcolor = chip.wafer.bg()
+        ops = _wiggle_ops(nTurns,h,radius,CCW,start_bend,stop_bend)
+        bnds,end,endDir = _meander_boundaries(struct.start,struct.direction,ops,radius,(w/2,-w/2))
+        chip.add(SolidPline((0,0),points=bnds[0]+bnds[1][::-1],bgcolor=bgcolor,solidFillQuads=True,**kwargStrip(kwargs)),
+                 structure=structure,absolutePos=end,newDir=endDir)
+        return
+    #collinear straight pairs are emitted as one segment (h is clamped so h-radius >= 0)
+    seg = h + radius + max(0,h-radius)
     if start_bend:
         Strip_bend(chip,structure,angle=90,CCW=CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
         if h > radius:
@@ -1085,52 +1123,30 @@ def Strip_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,CCW=True,
     else:
         Strip_straight(chip,structure,h,w=w,bgcolor=bgcolor,**kwargs)
     Strip_bend(chip,structure,angle=180,CCW=not CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
-    Strip_straight(chip,structure,h+radius,w=w,bgcolor=bgcolor,**kwargs)
-    if h > radius:
-        Strip_straight(chip,structure,h-radius,w=w,bgcolor=bgcolor,**kwargs)
+    Strip_straight(chip,structure,seg,w=w,bgcolor=bgcolor,**kwargs)
     Strip_bend(chip,structure,angle=180,CCW=CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
-    if h > radius:
-        Strip_straight(chip,structure,h-radius,w=w,bgcolor=bgcolor,**kwargs)
     for n in range(nTurns-1):
-        Strip_straight(chip,structure,h+radius,w=w,bgcolor=bgcolor,**kwargs)
+        Strip_straight(chip,structure,seg,w=w,bgcolor=bgcolor,**kwargs)
         Strip_bend(chip,structure,angle=180,CCW=not CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
-        Strip_straight(chip,structure,h+radius,w=w,bgcolor=bgcolor,**kwargs)
-        if h > radius:
-            Strip_straight(chip,structure,h-radius,w=w,bgcolor=bgcolor,**kwargs)
+        Strip_straight(chip,structure,seg,w=w,bgcolor=bgcolor,**kwargs)
         Strip_bend(chip,structure,angle=180,CCW=CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
-        if h > radius:
-            Strip_straight(chip,structure,h-radius,w=w,bgcolor=bgcolor,**kwargs)
+    if h > radius:
+        Strip_straight(chip,structure,h-radius,w=w,bgcolor=bgcolor,**kwargs)
     if stop_bend:
         Strip_bend(chip,structure,angle=90,CCW=not CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
     else:
         Strip_straight(chip,structure,radius,w=w,bgcolor=bgcolor,**kwargs)
 
 def Inductor_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,Width=None,CCW=True,start_bend = True,stop_bend=True,pad_to_width=None,w=None,s=None,radius=None,bgcolor=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if radius is None:
-        try:
-            radius = struct().defaults['radius']
-        except KeyError:
+        radius = struct.defaults.get('radius')
+        if radius is None:
             print('\x1b[33mradius not defined in ',chip.chipID,'!\x1b[0m')
             return
     if bgcolor is None:
         bgcolor = chip.wafer.bg()
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID,'!\x1b[0m')
-    if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
+    w,s = _get_defaults(struct,chip,w=w,s=s)
 
     if pad_to_width is None and Width is not None:
         pad_to_width = True
@@ -1141,6 +1157,10 @@ def Inductor_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,Width=
         return
     
     pm = (CCW - 0.5)*2
+    stripped = kwargStrip(kwargs)
+    #rectangles are collected and flushed in one batch at the end; Wire_bend only needs the
+    #structure frame, so only the position side effects have to happen in sequence
+    ents = []
     
     #put rectangles on either side to line up with max width
     if pad_to_width:
@@ -1148,84 +1168,64 @@ def Inductor_wiggles(chip,structure,length=None,nTurns=None,maxWidth=None,Width=
             print('\x1b[33mERROR:\x1b[0m cannot pad to width with Width undefined!')
             return
         if start_bend:
-            chip.add(dxf.rectangle(struct().getPos((0,h+radius+w/2)),(2*radius)+(nTurns)*4*radius,Width-(h+radius+w/2),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-            chip.add(dxf.rectangle(struct().getPos((0,-h-radius-w/2)),(stop_bend)*(radius+w/2)+(nTurns)*4*radius + radius-w/2,(h+radius+w/2)-Width,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+            p0,p1 = _local_to_global(struct,((0,h+radius+w/2),(0,-h-radius-w/2)))
+            ents.append(dxf.rectangle(p0,(2*radius)+(nTurns)*4*radius,Width-(h+radius+w/2),rotation=struct.direction,bgcolor=bgcolor,**stripped))
+            ents.append(dxf.rectangle(p1,(stop_bend)*(radius+w/2)+(nTurns)*4*radius + radius-w/2,(h+radius+w/2)-Width,rotation=struct.direction,bgcolor=bgcolor,**stripped))
         else:
-            chip.add(dxf.rectangle(struct().getPos((-h-radius-w/2,w/2)),(h+radius+w/2)-Width,(radius-w/2)+(nTurns)*4*radius,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
-            chip.add(dxf.rectangle(struct().getPos((h+radius+w/2,-radius)),Width-(h+radius+w/2),(stop_bend)*(radius+w/2)+(nTurns)*4*radius + w/2,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+            p0,p1 = _local_to_global(struct,((-h-radius-w/2,w/2),(h+radius+w/2,-radius)))
+            ents.append(dxf.rectangle(p0,(h+radius+w/2)-Width,(radius-w/2)+(nTurns)*4*radius,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+            ents.append(dxf.rectangle(p1,Width-(h+radius+w/2),(stop_bend)*(radius+w/2)+(nTurns)*4*radius + w/2,rotation=struct.direction,bgcolor=bgcolor,**stripped))
     #begin wiggles
     if start_bend:
-        chip.add(dxf.rectangle(struct().getPos((0,pm*w/2)),radius+w/2,pm*(h+radius),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+        ents.append(dxf.rectangle(_axis_pos(struct,0,pm*w/2),radius+w/2,pm*(h+radius),rotation=struct.direction,bgcolor=bgcolor,**stripped))
         Wire_bend(chip,structure,angle=90,CCW=CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
         if h > radius:
-            chip.add(dxf.rectangle(struct().getPos((0,-pm*w/2)),h+w/2,pm*(radius-w/2),valign=const.BOTTOM,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=struct(),length=h-radius)
+            ents.append(dxf.rectangle(_axis_pos(struct,0,-pm*w/2),h+w/2,pm*(radius-w/2),valign=const.BOTTOM,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+            struct.shiftPos(h-radius)
         else:
-            chip.add(dxf.rectangle(struct().getPos((0,-pm*w/2)),radius+w/2,pm*(radius-w/2),valign=const.BOTTOM,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+            ents.append(dxf.rectangle(_axis_pos(struct,0,-pm*w/2),radius+w/2,pm*(radius-w/2),valign=const.BOTTOM,rotation=struct.direction,bgcolor=bgcolor,**stripped))
     else:
-        chip.add(dxf.rectangle(struct().getPos((0,-pm*w/2)),2*radius+w/2,pm*(radius-w/2),valign=const.BOTTOM,rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=struct(),length=radius)
-        #struct().shiftPos(h)
-    chip.add(dxf.rectangle(struct().getPos((0,pm*w/2)),-h-max(h,radius)-radius-w/2,pm*(2*radius-w),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+        ents.append(dxf.rectangle(_axis_pos(struct,0,-pm*w/2),2*radius+w/2,pm*(radius-w/2),valign=const.BOTTOM,rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        struct.shiftPos(radius)
+        #struct.shiftPos(h)
+    ents.append(dxf.rectangle(_axis_pos(struct,0,pm*w/2),-h-max(h,radius)-radius-w/2,pm*(2*radius-w),rotation=struct.direction,bgcolor=bgcolor,**stripped))
     Wire_bend(chip,structure,angle=180,CCW=not CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
-    struct().shiftPos(h+radius)
-    if h > radius:
-        struct().shiftPos(h-radius)
-    chip.add(dxf.rectangle(struct().getPos((0,-pm*w/2)),-h-max(h,radius)-radius-w/2,pm*(-2*radius+w),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+    struct.shiftPos(h+radius + max(0,h-radius))
+    ents.append(dxf.rectangle(_axis_pos(struct,0,-pm*w/2),-h-max(h,radius)-radius-w/2,pm*(-2*radius+w),rotation=struct.direction,bgcolor=bgcolor,**stripped))
     Wire_bend(chip,structure,angle=180,CCW=CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
     if h > radius:
-        struct().shiftPos(h-radius)
+        struct.shiftPos(h-radius)
     for n in range(nTurns-1):
-        struct().shiftPos(h+radius)
-        chip.add(dxf.rectangle(struct().getPos((0,pm*w/2)),-h-max(h,radius)-radius-w/2,pm*(2*radius-w),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+        struct.shiftPos(h+radius)
+        ents.append(dxf.rectangle(_axis_pos(struct,0,pm*w/2),-h-max(h,radius)-radius-w/2,pm*(2*radius-w),rotation=struct.direction,bgcolor=bgcolor,**stripped))
         Wire_bend(chip,structure,angle=180,CCW=not CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
-        struct().shiftPos(2*h)
-        chip.add(dxf.rectangle(struct().getPos((0,-pm*w/2)),-h-max(h,radius)-radius-w/2,pm*(-2*radius+w),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+        struct.shiftPos(2*h)
+        ents.append(dxf.rectangle(_axis_pos(struct,0,-pm*w/2),-h-max(h,radius)-radius-w/2,pm*(-2*radius+w),rotation=struct.direction,bgcolor=bgcolor,**stripped))
         Wire_bend(chip,structure,angle=180,CCW=CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
-        struct().shiftPos(h-radius)
-    chip.add(dxf.rectangle(struct().getLastPos((-radius-w/2,pm*w/2)),w/2+h,pm*(radius-w/2),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=struct())
+        struct.shiftPos(h-radius)
+    ents.append(dxf.rectangle(struct.getLastPos((-radius-w/2,pm*w/2)),w/2+h,pm*(radius-w/2),rotation=struct.direction,bgcolor=bgcolor,**stripped))
     if stop_bend:
-        chip.add(dxf.rectangle(struct().getPos((radius+w/2,-pm*w/2)),h+radius,pm*(radius+w/2),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)))
+        ents.append(dxf.rectangle(_axis_pos(struct,radius+w/2,-pm*w/2),h+radius,pm*(radius+w/2),rotation=struct.direction,bgcolor=bgcolor,**stripped))
         Wire_bend(chip,structure,angle=90,CCW=not CCW,w=w,radius=radius,bgcolor=bgcolor,**kwargs)
     else:
         #CPW_straight(chip,structure,radius,w=w,s=s,bgcolor=bgcolor)
-        chip.add(dxf.rectangle(struct().getPos((0,pm*w/2)),radius,pm*(radius-w/2),rotation=struct().direction,bgcolor=bgcolor,**kwargStrip(kwargs)),structure=struct(),length=radius)
+        ents.append(dxf.rectangle(_axis_pos(struct,0,pm*w/2),radius,pm*(radius-w/2),rotation=struct.direction,bgcolor=bgcolor,**stripped))
+        struct.shiftPos(radius)
+        
+    chip.add_many(ents)
         
 def TwoPinCPW_wiggles(chip,structure,w=None,s_ins=None,s_out=None,s=None,Width=None,maxWidth=None,**kwargs):
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
-    if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if s is not None:
-        #s overridden somewhere above
-        if s_ins is None:
-            s_ins = s
-        if s_out is None:
-            s_out = s
-    if s_ins is None:
-        try:
-            s_ins = struct().defaults['s']
-        except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-    if s_out is None:
-        if Width is not None:
-            s_out = Width - w - s_ins/2
-        else:
-            try:
-                s_out = struct().defaults['s']
-            except KeyError:
-                print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
-                
-    s0 = struct().clone()
-    maxWidth = wiggle_calc(chip,struct(),Width=Width,maxWidth=maxWidth,w=s_ins+2*w,s=0,**kwargs)['maxWidth']
+    struct = _resolve_structure(chip,structure)
+    w,s_ins,s_out = _twoPinCPW_dims(struct,chip,w,s_ins,s_out,Width,s)
+
+    s0 = struct.clone()
+    params = wiggle_calc(chip,struct,Width=Width,maxWidth=maxWidth,w=s_ins+2*w,s=0,**kwargs)
+    maxWidth = params['maxWidth']
+    #solve once and pin the turn count: both sub-meanders share the same skeleton (see _wiggle_ops),
+    #so their internal wiggle_calc calls reduce to a no-op verification
+    kwargs = {**kwargs,'nTurns':params['nTurns']}
     Inductor_wiggles(chip, s0, w=s_ins+2*w,Width=Width,maxWidth=maxWidth,**kwargs)
-    Strip_wiggles(chip, struct(), w=s_ins,maxWidth=maxWidth-w,**kwargs)
+    Strip_wiggles(chip, struct, w=s_ins,maxWidth=maxWidth-w,**kwargs)
 
 def CPW_pincer(chip,structure,pincer_w,pincer_l,pincer_padw,pincer_tee_r=0,pad_r=None,w=None,s=None,pincer_flipped=False,bgcolor=None, polygon_overlap=True, **kwargs):
     '''
@@ -1238,23 +1238,15 @@ def CPW_pincer(chip,structure,pincer_w,pincer_l,pincer_padw,pincer_tee_r=0,pad_r
     s:              pincer trace gap
     pincer_flipped: equivalent to hflip
     '''
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
+        w = struct.defaults.get('w')
+        if w is None:
             w=0
             print('\x1b[33mw not defined in ',chip.chipID)
     if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
+        s = struct.defaults.get('s')
+        if s is None:
             print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
     if pad_r is None:
         pincer_r = pincer_padw/2 + s
@@ -1263,13 +1255,13 @@ def CPW_pincer(chip,structure,pincer_w,pincer_l,pincer_padw,pincer_tee_r=0,pad_r
         pincer_r = pincer_padw/2+s+abs(pad_r)#prevent negative entries
         pad_r = abs(pad_r)
         
-    if not pincer_flipped: s_start = struct().clone()
+    if not pincer_flipped: s_start = struct.clone()
     else:
-        struct().shiftPos(pincer_padw+pincer_tee_r+2*s,angle=180)
-        s_start = struct().clone()
+        struct.shiftPos(pincer_padw+pincer_tee_r+2*s,angle=180)
+        s_start = struct.clone()
 
 
-    s_left, s_right = CPW_tee(chip, struct(), w=w, s=s, w1=pincer_padw, s1=s, radius=pincer_tee_r + s, polygon_overlap=polygon_overlap, **kwargs)
+    s_left, s_right = CPW_tee(chip, struct, w=w, s=s, w1=pincer_padw, s1=s, radius=pincer_tee_r + s, polygon_overlap=polygon_overlap, **kwargs)
 
     CPW_straight(chip, s_left, length=(pincer_w-w-2*s-2*pincer_tee_r)/2-pad_r, **kwargs)
     CPW_straight(chip, s_right, length=(pincer_w-w-2*s-2*pincer_tee_r)/2-pad_r, **kwargs)
@@ -1297,9 +1289,9 @@ def CPW_pincer(chip,structure,pincer_w,pincer_l,pincer_padw,pincer_tee_r=0,pad_r
 
     if not pincer_flipped:
         s_start.shiftPos(pincer_padw+pincer_tee_r+2*s)
-        struct().updatePos(s_start.getPos())
+        struct.updatePos(s_start.getPos())
     else: 
-        struct().updatePos(s_start.getPos(),angle=180)
+        struct.updatePos(s_start.getPos(),angle=180)
         #struct.direction = s_start.direction + 180
         
 def CPW_tee_stub(chip,structure,stub_length,stub_w,tee_r=0,outer_width=None,w=None,s=None,pincer_flipped=False,bgcolor=None,**kwargs):
@@ -1312,32 +1304,24 @@ def CPW_tee_stub(chip,structure,stub_length,stub_w,tee_r=0,outer_width=None,w=No
     s:              pincer trace gap
     pincer_flipped: equivalent to hflip
     '''
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
-        try:
-            w = struct().defaults['w']
-        except KeyError:
+        w = struct.defaults.get('w')
+        if w is None:
             w=0
             print('\x1b[33mw not defined in ',chip.chipID)
     if s is None:
-        try:
-            s = struct().defaults['s']
-        except KeyError:
+        s = struct.defaults.get('s')
+        if s is None:
             print('\x1b[33ms not defined in ',chip.chipID,'!\x1b[0m')
         
-    if not pincer_flipped: s_start = struct().clone()
+    if not pincer_flipped: s_start = struct.clone()
     else:
-        struct().shiftPos(stub_w+2*s,angle=180)
-        #struct().direction += 180
-        s_start = struct().clone()
+        struct.shiftPos(stub_w+2*s,angle=180)
+        #struct.direction += 180
+        s_start = struct.clone()
 
-    s_left, s_right = CPW_tee(chip, struct(), w=w, s=s, w1=stub_w, s1=s, radius=tee_r + s, **kwargs)
+    s_left, s_right = CPW_tee(chip, struct, w=w, s=s, w1=stub_w, s1=s, radius=tee_r + s, **kwargs)
 
     CPW_straight(chip, s_left, length=(stub_length-w-2*s-stub_w)/2, **kwargs)
     CPW_stub_round(chip, s_left,**kwargs)
@@ -1346,14 +1330,35 @@ def CPW_tee_stub(chip,structure,stub_length,stub_w,tee_r=0,outer_width=None,w=No
 
     if not pincer_flipped:
         s_start.shiftPos(stub_w+2*s)
-        struct().updatePos(s_start.getPos())
+        struct.updatePos(s_start.getPos())
     else: 
-        struct().updatePos(s_start.getPos(),angle=180)
+        struct.updatePos(s_start.getPos(),angle=180)
         #struct.direction = s_start.direction + 180
     
 # ===============================================================================
 # Airbridges (Lincoln Labs designs)
 # ===============================================================================
+#Lincoln Labs airbridge rules BR.W.{1,2,3} / RR.L.{1,2,3}: (max xvr_length, xvr_width, rr_length)
+_LL_XVR_TABLE = ((16, 5, 8), (27, 7.5, 10), (32, 10, 14))
+_LL_XVR_BOUNDS = tuple(row[0] for row in _LL_XVR_TABLE)
+
+def _ll_xvr_params(xvr_length):
+    #look up (xvr_width, rr_length) for a crossover length; shared by Airbridge and CPW_bridge
+    assert 5 <= xvr_length <= _LL_XVR_BOUNDS[-1], f'xvr_length {xvr_length} is out of range'
+    row = _LL_XVR_TABLE[bisect_left(_LL_XVR_BOUNDS, xvr_length)]
+    return row[1], row[2]
+
+_LLParams = namedtuple('_LLParams','xvr_length xvr_width rr_length rr_width rr_br_gap rr_cpw_gap')
+
+def _resolve_ll_params(xvr_length,w,s,rr_cpw_gap):
+    #shared Lincoln Labs parameter resolution for Airbridge and CPW_bridge
+    rr_br_gap = 1.5 # RR.BR.E.1
+    assert rr_cpw_gap + rr_br_gap >= 1.5 # RR.E.1
+    if xvr_length is None:
+        xvr_length = w + 2*s + 2*(rr_cpw_gap)
+    xvr_width, rr_length = _ll_xvr_params(xvr_length) # BR.W.1-3, RR.L.1-3
+    return _LLParams(xvr_length, xvr_width, rr_length, xvr_width + 3, rr_br_gap, rr_cpw_gap) # RR.W.1
+
 def setupAirbridgeLayers(wafer:m.Wafer,BRLAYER='BRIDGE',RRLAYER='TETHER',brcolor=41,rrcolor=32):
     #add correct layers to wafer, and cache layer
     wafer.addLayer(BRLAYER,brcolor)
@@ -1361,6 +1366,17 @@ def setupAirbridgeLayers(wafer:m.Wafer,BRLAYER='BRIDGE',RRLAYER='TETHER',brcolor
     wafer.addLayer(RRLAYER,rrcolor)
     wafer.RRLAYER=RRLAYER
 
+def _get_airbridge_layers(wafer):
+    #resolve (BRLAYER, RRLAYER), running setup on first use; getattr keeps the
+    #common already-set-up case off the exception path
+    BRLAYER = getattr(wafer,'BRLAYER',None)
+    RRLAYER = getattr(wafer,'RRLAYER',None)
+    if BRLAYER is None or RRLAYER is None:
+        setupAirbridgeLayers(wafer)
+        BRLAYER = wafer.BRLAYER
+        RRLAYER = wafer.RRLAYER
+    return BRLAYER,RRLAYER
+
 def Airbridge(
     chip, structure, cpw_w=None, cpw_s=None, xvr_width=None, xvr_length=None, rr_width=None, rr_length=None,
     rr_br_gap=None, rr_cpw_gap=None, shape_overlap=0, br_radius=0, clockwise=False, lincolnLabs=False, BRLAYER=None, RRLAYER=None, **kwargs):
@@ -1369,72 +1385,43 @@ def Airbridge(
     xvr_length overrides cpw_w and cpw_s.
     """
     assert lincolnLabs, 'Not implemented for normal usage'
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if cpw_w is None:
         try:
-            cpw_w = struct().defaults['w']
+            cpw_w = struct.defaults['w']
         except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
+            warnings.warn(f'w not defined in {chip.chipID}',stacklevel=2)
     if cpw_s is None:
         try:
-            cpw_s = struct().defaults['s']
+            cpw_s = struct.defaults['s']
         except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID)
+            warnings.warn(f's not defined in {chip.chipID}',stacklevel=2)
 
     #get layers from wafer
-    if BRLAYER is None:
-        try:
-            BRLAYER = chip.wafer.BRLAYER
-        except AttributeError:
-            setupAirbridgeLayers(chip.wafer)
-            BRLAYER = chip.wafer.BRLAYER
-    if RRLAYER is None:
-        try:
-            RRLAYER = chip.wafer.RRLAYER
-        except AttributeError:
-            setupAirbridgeLayers(chip.wafer)
-            RRLAYER = chip.wafer.RRLAYER
+    if BRLAYER is None or RRLAYER is None:
+        wafer_br,wafer_rr = _get_airbridge_layers(chip.wafer)
+        if BRLAYER is None: BRLAYER = wafer_br
+        if RRLAYER is None: RRLAYER = wafer_rr
 
     if lincolnLabs:
-        rr_br_gap = 1.5 # RR.BR.E.1
         if rr_cpw_gap is None: rr_cpw_gap = 2 # LL requires >= 0 (RR.E.1)
-        else: assert rr_cpw_gap + rr_br_gap >= 1.5 # RR.E.1
-
-        if xvr_length is None:
-            xvr_length = cpw_w + 2*cpw_s + 2*(rr_cpw_gap)
-
-        if 5 <= xvr_length <= 16: # BR.W.1, RR.L.1
-            xvr_width = 5
-            rr_length = 8
-        elif 16 < xvr_length <= 27: # BR.W.2, RR.L.2
-            xvr_width = 7.5
-            rr_length = 10
-        elif 27 < xvr_length <= 32: # BR.W.3, RR.L.3
-            xvr_width = 10
-            rr_length = 14
-        rr_width = xvr_width + 3 # RR.W.1
+        xvr_length, xvr_width, rr_length, rr_width, rr_br_gap, rr_cpw_gap = _resolve_ll_params(xvr_length, cpw_w, cpw_s, rr_cpw_gap)
         shape_overlap = 0.1 # LL requires >= 0.1
         delta = 0
         if br_radius > 0:
             r = br_radius - cpw_w/2 - cpw_s
-            delta = r*(1-math.sqrt(1-1/r**2*((rr_width + 2*rr_br_gap)/2)**2))
+            half = (rr_width + 2*rr_br_gap)*0.5
+            #algebraically r*(1-sqrt(1-(half/r)^2)); this form avoids the cancellation when half << r
+            delta = r - math.sqrt(r*r - half*half)
         # this code does not check if your bend is super severe and the necessary delta
         # changes the necessary xvr_widths and rr_lengths, so don't do anything extreme
 
-    if clockwise:
-        delta_left = 0
-        delta_right = delta
-    else:
-        delta_right = 0
-        delta_left = delta
+    #arithmetic select instead of a branch; vectorizes directly if callers ever array clockwise
+    cw = int(bool(clockwise))
+    delta_left = delta*(1-cw)
+    delta_right = delta*cw
 
-    chip.add(DogBone(struct().start,
+    chip.add(DogBone(struct.start,
                      xvr_width,
                      xvr_length,
                      rr_width,
@@ -1442,14 +1429,13 @@ def Airbridge(
                      rr_br_gap,
                      delta_left,
                      delta_right,
-                     rotation=struct().direction, layer=BRLAYER, **kwargs),
-             structure=struct().clone())
+                     rotation=struct.direction, layer=BRLAYER, **kwargs))
 
-    s_left = struct().cloneAlong(vector=(0, xvr_length/2+delta_left+rr_br_gap))
+    s_left = struct.cloneAlong(vector=(0, xvr_length/2+delta_left+rr_br_gap))
     s_left.direction += 90
     Strip_straight(chip, s_left, length=rr_length, w=rr_width, layer=RRLAYER, **kwargs)
 
-    s_right = struct().cloneAlong(vector=(0, -(xvr_length/2+delta_left+rr_br_gap)))
+    s_right = struct.cloneAlong(vector=(0, -(xvr_length/2+delta_left+rr_br_gap)))
     s_right.direction -= 90
     Strip_straight(chip, s_right, length=rr_length, w=rr_width, layer=RRLAYER, **kwargs)
 
@@ -1466,43 +1452,22 @@ def CPW_bridge(chip, structure, xvr_length=None, w=None, s=None, lincolnLabs=Fal
     structure is oriented at the same place as the structure for Airbridge.
     """
     assert lincolnLabs, 'Not implemented for normal usage'
-    def struct():
-        if isinstance(structure,m.Structure):
-            return structure
-        elif isinstance(structure,tuple):
-            return m.Structure(chip,structure)
-        else:
-            return chip.structure(structure)
+    struct = _resolve_structure(chip,structure)
     if w is None:
         try:
-            w = struct().defaults['w']
+            w = struct.defaults['w']
         except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
+            warnings.warn(f'w not defined in {chip.chipID}',stacklevel=2)
     if s is None:
         try:
-            s = struct().defaults['s']
+            s = struct.defaults['s']
         except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID)
+            warnings.warn(f's not defined in {chip.chipID}',stacklevel=2)
 
     if lincolnLabs:
-        rr_br_gap = 1.5 # RR.BR.E.1
-        rr_cpw_gap = 0 # LL requires >= 0 (RR.E.1)
-        if xvr_length is None:
-            xvr_length = w + 2*s + 2*(rr_cpw_gap)
-        if 5 <= xvr_length <= 16:
-            xvr_width = 5
-            rr_length = 8
-        elif 16 < xvr_length <= 27:
-            xvr_width = 7.5
-            rr_length = 10
-        elif 27 < xvr_length <= 32:
-            xvr_width = 10
-            rr_length = 14
-        else:
-            assert False, f'xvr_length {xvr_length} is out of range'
-        rr_width = xvr_width + 3
+        xvr_length, xvr_width, rr_length, rr_width, rr_br_gap, rr_cpw_gap = _resolve_ll_params(xvr_length, w, s, 0)
 
-    s_left, s_right = Airbridge(chip, struct(), xvr_length=xvr_length, lincolnLabs=lincolnLabs, **kwargs)
+    s_left, s_right = Airbridge(chip, struct, xvr_length=xvr_length, lincolnLabs=lincolnLabs, **kwargs)
 
     w0 = rr_width+2*rr_br_gap
     s0 = s/w * w0
@@ -1519,33 +1484,57 @@ def CPW_bridge(chip, structure, xvr_length=None, w=None, s=None, lincolnLabs=Fal
 
 
 
-def Capa_linker(chip, pos, length, width, dist_ground_height, 
+def _pair(v):
+    # pad a one-element per-side parameter to (first, second) form
+    return (v[0], v[0]) if len(v)==1 else tuple(v)
+
+def _rotate_offsets(px,py,sin,cos,offsets):
+    # rotate local-frame anchor offsets into the global frame in one pass
+    return tuple((px + x*cos - y*sin, py + x*sin + y*cos) for x,y in offsets)
+
+def _linker_coords(px,py,sin,cos,length,width,wp0,hp0,hp1,dl):
+    # anchor points for one Linker pass: (pad1, linker, pad2)
+    # offsets are written in the rotation=0 frame and rotated once
+    offsets = ((0.0, -hp0/2),
+               (wp0-dl, -width/2),
+               (wp0+length-3*dl, -hp1/2))
+    return _rotate_offsets(px,py,sin,cos,offsets)
+
+def _linker_tee_coords(px,py,sin,cos,length,width,wp0,wp1,hp0,hp1,wt0,wt1,ht0,ht1,dl):
+    # anchor points for one Linker_tee pass, local frame like _linker_coords:
+    # (pad1, tee1_up, tee1_down, linker, pad2, tee2_up, tee2_down)
+    x2 = wp0+length-3*dl
+    offsets = ((0.0, -hp0/2),
+               (-wt0, -hp0/2),
+               (-wt0, hp0/2-ht0),
+               (wp0-dl, -width/2),
+               (x2, -hp1/2),
+               (x2+wp1, -hp1/2),
+               (x2+wp1, hp1/2-ht1))
+    return _rotate_offsets(px,py,sin,cos,offsets)
+
+def Capa_linker(chip, pos, length, width, dist_ground_height,
                 dist_ground_width, dist_ground_strip, width_pad,
                  height_pad, radius,rotation, w=None, s=None,
                  bondwires=False,bond_pitch=70,incl_end_bond=True,
                  bgcolor=None, XLAYER=None, MLAYER=None, **kwargs):
 
-    thisStructure = None
-    if isinstance(pos,tuple):
-        thisStructure = m.Structure(chip,start=pos,direction=rotation)
-        
-    def struct():
-        if isinstance(pos,m.Structure):
-            return pos
-        elif isinstance(pos,tuple):
-            return thisStructure
-        else:
-            return chip.structure(pos)
+    if isinstance(pos,m.Structure):
+        struct = pos
+    elif isinstance(pos,tuple):
+        struct = m.Structure(chip,start=pos,direction=rotation)
+    else:
+        struct = chip.structure(pos)
     if w is None:
         try:
-            w = struct().defaults['w']
+            w = struct.defaults['w']
         except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
+            warnings.warn(f'w not defined in {chip.chipID}',stacklevel=2)
     if s is None:
         try:
-            s = struct().defaults['s']
+            s = struct.defaults['s']
         except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID)
+            warnings.warn(f's not defined in {chip.chipID}',stacklevel=2)
 
 
 
@@ -1559,62 +1548,57 @@ def Capa_linker(chip, pos, length, width, dist_ground_height,
 
 
 
-    if len(width_pad)==1:
-        width_pad = [width_pad[0]]*2
-    if len(height_pad)==1:
-        height_pad = [height_pad[0]]*2
-    if len(dist_ground_width)==1:
-        dist_ground_width = [dist_ground_width[0]]*2
-    if len(dist_ground_height)==1:
-        dist_ground_height = [dist_ground_height[0]]*2
+    width_pad = _pair(width_pad)
+    height_pad = _pair(height_pad)
+    dist_ground_width = _pair(dist_ground_width)
+    dist_ground_height = _pair(dist_ground_height)
 
     dl = 10e-3
 
+    # scalar trig once per call; shared by the metal and ground Linker passes
+    # axis-aligned rotations take exact values from the quadrant table (no trig, no rounding)
+    if rotation % 90 == 0:
+        cos,sin = _SC90[int(rotation//90) % 4]
+    else:
+        _r = math.radians(rotation)
+        sin, cos = math.sin(_r), math.cos(_r)
+
 
     def Linker(chip, pos, length, width, width_pad, height_pad, radius,rotation, **kwargs):
 
         # adujst the length of the linker to account for the width of the pads
 
         length = length - width_pad[0] - width_pad[1]
-        sin = np.sin(np.pi/180*rotation)
-        cos = np.cos(np.pi/180*rotation)
 
-        # draw the first pad as a rounded rectangle
+        p_pad1,p_link,p_pad2 = _linker_coords(pos[0],pos[1],sin,cos,length,width,width_pad[0],height_pad[0],height_pad[1],dl)
 
-        start_point = (pos[0] + sin*height_pad[0]/2, pos[1]- cos*height_pad[0]/2)
+        # draw the first pad as a rounded rectangle
 
-        
-        
-        
-        pad1 = RoundRect(start_point, height=height_pad[0], radius=radius,width=width_pad[0], roundCorners=[1,1,1,1],
+        pad1 = RoundRect(p_pad1, height=height_pad[0], radius=radius,width=width_pad[0], roundCorners=[1,1,1,1],
                                             rotation= rotation,**kwargs)
         chip.add(pad1)
 
 
         # draw the linker as a rectangle
 
-        start_point = (pos[0] + sin*width/2 + (width_pad[0]-dl)*cos, pos[1]- cos*width/2 + (width_pad[0] - dl)*sin)
-
-
-        linker = RoundRect(start_point, height=width, width=length, radius=0, rotation= rotation,
+        linker = RoundRect(p_link, height=width, width=length, radius=0, rotation= rotation,
                             roundCorners=[0,0,0,0], **kwargs)
-        
+
         chip.add(linker)
 
         # draw the second pad as a rounded rectangle
 
-        start_point = (start_point[0] + (length-2*dl)*cos + sin*(height_pad[1]/2 - width/2) , start_point[1] + (length-2*dl)*sin - cos*(height_pad[1]/2 - width/2))
-
-        pad2 = RoundRect(start_point, height=height_pad[1], radius=radius,width=width_pad[1], roundCorners=[1,1,1,1],
+        pad2 = RoundRect(p_pad2, height=height_pad[1], radius=radius,width=width_pad[1], roundCorners=[1,1,1,1],
                                             rotation= rotation, **kwargs)
-        
+
         chip.add(pad2)
 
     #add the linker to the structure
 
     start = pos
+    mbg = chip.bg(MLAYER) #resolve the metal layer color once
 
-    Linker(chip, start, length, width, width_pad, height_pad, radius,rotation,layer=MLAYER,bgcolor=chip.bg(MLAYER))
+    Linker(chip, start, length, width, width_pad, height_pad, radius,rotation,layer=MLAYER,bgcolor=mbg)
 
     #add the ground plane to the structure
     # correct the pad size to account for ground plane distance 
@@ -1626,21 +1610,19 @@ def Capa_linker(chip, pos, length, width, dist_ground_height,
     width_ground = width + 2*dist_ground_strip
 
 
-    sin = np.sin(np.pi/180*rotation)
-    cos = np.cos(np.pi/180*rotation)
-    
-
     start_ground = (start[0] - cos*(dist_ground_width[0] -dl),start[1] - sin*(dist_ground_width[0] - dl))
     Linker(chip, start_ground, length_ground, width_ground, width_pad, height_pad, radius,rotation)
 
     if bondwires: # bond parameters patched through kwargs
         num_bonds = int(length/bond_pitch)
-        this_struct = struct().clone()
-        this_struct.shiftPos(bond_pitch)
         if not incl_end_bond: num_bonds -= 1
-        for i in range(num_bonds):
-            Airbridge(chip, this_struct, **kwargs)
-            this_struct.shiftPos(bond_pitch)
+        if num_bonds > 0: #skip the structure clone when there is nothing to draw
+            this_struct = struct.clone()
+            shift = this_struct.shiftPos #bind once for the loop
+            shift(bond_pitch)
+            for i in range(num_bonds):
+                Airbridge(chip, this_struct, **kwargs)
+                shift(bond_pitch)
 
 
 def Capa_linker_tee(chip, pos, length, width, dist_ground_height, 
@@ -1649,27 +1631,22 @@ def Capa_linker_tee(chip, pos, length, width, dist_ground_height,
                  bondwires=False,bond_pitch=70,incl_end_bond=True,
                  bgcolor=None, XLAYER=None, MLAYER=None, **kwargs):
 
-    thisStructure = None
-    if isinstance(pos,tuple):
-        thisStructure = m.Structure(chip,start=pos,direction=rotation)
-        
-    def struct():
-        if isinstance(pos,m.Structure):
-            return pos
-        elif isinstance(pos,tuple):
-            return thisStructure
-        else:
-            return chip.structure(pos)
+    if isinstance(pos,m.Structure):
+        struct = pos
+    elif isinstance(pos,tuple):
+        struct = m.Structure(chip,start=pos,direction=rotation)
+    else:
+        struct = chip.structure(pos)
     if w is None:
         try:
-            w = struct().defaults['w']
+            w = struct.defaults['w']
         except KeyError:
-            print('\x1b[33mw not defined in ',chip.chipID)
+            warnings.warn(f'w not defined in {chip.chipID}',stacklevel=2)
     if s is None:
         try:
-            s = struct().defaults['s']
+            s = struct.defaults['s']
         except KeyError:
-            print('\x1b[33ms not defined in ',chip.chipID)
+            warnings.warn(f's not defined in {chip.chipID}',stacklevel=2)
 
 
 
@@ -1683,113 +1660,97 @@ def Capa_linker_tee(chip, pos, length, width, dist_ground_height,
 
 
 
-    if len(width_pad)==1:
-        width_pad = [width_pad[0]]*2
-    if len(height_pad)==1:
-        height_pad = [height_pad[0]]*2
-    if len(dist_ground_width)==1:
-        dist_ground_width = [dist_ground_width[0]]*2
-    if len(dist_ground_height)==1:
-        dist_ground_height = [dist_ground_height[0]]*2
-    if len(width_tee)==1:
-        width_tee = [width_tee[0]]*2
-    if len(height_tee)==1:
-        height_tee = [height_tee[0]]*2
+    width_pad = _pair(width_pad)
+    height_pad = _pair(height_pad)
+    dist_ground_width = _pair(dist_ground_width)
+    dist_ground_height = _pair(dist_ground_height)
+    width_tee = _pair(width_tee)
+    height_tee = _pair(height_tee)
 
     dl = 10e-3
 
+    # scalar trig once per call; shared by the metal and ground Linker_tee passes
+    # axis-aligned rotations take exact values from the quadrant table (no trig, no rounding)
+    if rotation % 90 == 0:
+        cos,sin = _SC90[int(rotation//90) % 4]
+    else:
+        _r = math.radians(rotation)
+        sin, cos = math.sin(_r), math.cos(_r)
+
 
     def Linker_tee(chip, pos, length, width, width_pad, height_pad, width_tee, height_tee, radius,rotation, **kwargs):
 
         # adujst the length of the linker to account for the width of the pads
 
         length = length - width_pad[0] - width_pad[1]
-        sin = np.sin(np.pi/180*rotation)
-        cos = np.cos(np.pi/180*rotation)
 
-        # draw the first pad as a rounded rectangle
+        p_pad1,p_tee1_up,p_tee1_down,p_link,p_pad2,p_tee2_up,p_tee2_down = _linker_tee_coords(
+            pos[0],pos[1],sin,cos,length,width,width_pad[0],width_pad[1],height_pad[0],height_pad[1],
+            width_tee[0],width_tee[1],height_tee[0],height_tee[1],dl)
 
-        start_point = (pos[0] + sin*height_pad[0]/2, pos[1]- cos*height_pad[0]/2)
+        # draw the first pad as a rounded rectangle
 
-        
-        
         if width_tee[0] != 0:
 
-            pad1 = RoundRect(start_point, height=height_pad[0], radius=radius,width=width_pad[0], roundCorners=[0,1,1,0],
+            pad1 = RoundRect(p_pad1, height=height_pad[0], radius=radius,width=width_pad[0], roundCorners=[0,1,1,0],
                                                 rotation= rotation,**kwargs)
             chip.add(pad1)
 
         else:
 
-            pad1 = RoundRect(start_point, height=height_pad[0], radius=radius,width=width_pad[0], roundCorners=[1,1,1,1],
+            pad1 = RoundRect(p_pad1, height=height_pad[0], radius=radius,width=width_pad[0], roundCorners=[1,1,1,1],
                                                 rotation= rotation,**kwargs)
             chip.add(pad1)
 
 
         if width_tee[0] != 0:
 
-            start_point = (pos[0] + sin*(height_pad[0]/2) - cos*(width_tee[0]), pos[1]- cos*(height_pad[0]/2) - sin*width_tee[0])
-
-            tee1_up = RoundRect(start_point, height=height_tee[0], radius=radius,width=width_tee[0], roundCorners=[1,0,0,1],
+            tee1_up = RoundRect(p_tee1_up, height=height_tee[0], radius=radius,width=width_tee[0], roundCorners=[1,0,0,1],
                                                 rotation= rotation,**kwargs)
-            
-            chip.add(tee1_up)
 
-            # start_point = (pos[0] - sin*(height_pad[0]/2) - cos*(width_tee[0]), pos[1]+ cos*(height_pad[0]/2) + sin*width_tee[0]) 
-            # start_point = (pos[0] - cos*(width_tee[0]), pos[1] + sin*width_tee[0]) 
-            # start_point = (pos[0] -sin*(height_pad[0]/2 - height_tee[0]/2), pos[1] - cos*(height_pad[0]/2 - height_tee[0]/2))
-            start_point = (pos[0] -sin*(height_pad[0]/2-height_tee[0]) -cos*width_tee[0], pos[1] + cos*(height_pad[0]/2-height_tee[0])-sin*width_tee[0])
+            chip.add(tee1_up)
 
-            tee1_down = RoundRect(start_point, height=height_tee[0], radius=radius,width=width_tee[0], roundCorners=[1,0,0,1],
+            tee1_down = RoundRect(p_tee1_down, height=height_tee[0], radius=radius,width=width_tee[0], roundCorners=[1,0,0,1],
                                                 rotation= rotation,**kwargs)
-            
+
             chip.add(tee1_down)
 
 
         # draw the linker as a rectangle
 
-        start_point = (pos[0] + sin*width/2 + (width_pad[0]-dl)*cos, pos[1]- cos*width/2 + (width_pad[0] - dl)*sin)
-
-
-        linker = RoundRect(start_point, height=width, width=length, radius=0, rotation= rotation,
+        linker = RoundRect(p_link, height=width, width=length, radius=0, rotation= rotation,
                             roundCorners=[0,0,0,0], **kwargs)
-        
+
         chip.add(linker)
 
         # draw the second pad as a rounded rectangle
 
-        start_point = (start_point[0] + (length-2*dl)*cos + sin*(height_pad[1]/2 - width/2) , start_point[1] + (length-2*dl)*sin - cos*(height_pad[1]/2 - width/2))
-
         if width_tee[1] != 0:
 
-            pad2 = RoundRect(start_point, height=height_pad[1], radius=radius,width=width_pad[1], roundCorners=[1,0,0,1],
+            pad2 = RoundRect(p_pad2, height=height_pad[1], radius=radius,width=width_pad[1], roundCorners=[1,0,0,1],
                                                 rotation= rotation, **kwargs)
-            
+
             chip.add(pad2)
 
         else:
 
-            pad2 = RoundRect(start_point, height=height_pad[1], radius=radius,width=width_pad[1], roundCorners=[1,1,1,1],
+            pad2 = RoundRect(p_pad2, height=height_pad[1], radius=radius,width=width_pad[1], roundCorners=[1,1,1,1],
                                                 rotation= rotation, **kwargs)
-            
+
             chip.add(pad2)
 
         # add the tee to the second pad
 
         if width_tee[1] != 0:
 
-            start_point = (start_point[0] + cos*width_pad[1], start_point[1]+ sin*width_pad[1])
-
-            tee2_up = RoundRect(start_point, height=height_tee[1], radius=radius,width=width_tee[1], roundCorners=[0,1,1,0],
+            tee2_up = RoundRect(p_tee2_up, height=height_tee[1], radius=radius,width=width_tee[1], roundCorners=[0,1,1,0],
                                                 rotation= rotation,**kwargs)
-            
-            chip.add(tee2_up)
 
-            start_point = (start_point[0] - sin*(height_pad[1] - height_tee[1]), start_point[1] + cos*(height_pad[1] - height_tee[1]))
+            chip.add(tee2_up)
 
-            tee2_down = RoundRect(start_point, height=height_tee[1], radius=radius,width=width_tee[1], roundCorners=[0,1,1,0],
+            tee2_down = RoundRect(p_tee2_down, height=height_tee[1], radius=radius,width=width_tee[1], roundCorners=[0,1,1,0],
                                                 rotation= rotation,**kwargs)
-            
+
             chip.add(tee2_down)
 
             
@@ -1797,8 +1758,9 @@ def Capa_linker_tee(chip, pos, length, width, dist_ground_height,
     #add the linker to the structure
 
     start = pos
+    mbg = chip.bg(MLAYER) #resolve the metal layer color once
 
-    Linker_tee(chip, start, length, width, width_pad, height_pad, width_tee, height_tee,radius,rotation,layer=MLAYER,bgcolor=chip.bg(MLAYER))
+    Linker_tee(chip, start, length, width, width_pad, height_pad, width_tee, height_tee,radius,rotation,layer=MLAYER,bgcolor=mbg)
 
     #add the ground plane to the structure
     # correct the pad size to account for ground plane distance 
@@ -1813,19 +1775,17 @@ def Capa_linker_tee(chip, pos, length, width, dist_ground_height,
     height_tee = [height_tee[0] + 2*dist_ground_height[0], height_tee[1] + 2*dist_ground_height[1]]
 
 
-    sin = np.sin(np.pi/180*rotation)
-    cos = np.cos(np.pi/180*rotation)
-    
-
     start_ground = (start[0] - cos*(dist_ground_width[0] -dl),start[1] - sin*(dist_ground_width[0] - dl))
     Linker_tee(chip, start_ground, length_ground, width_ground, width_pad, height_pad, width_tee, height_tee,radius,rotation)
 
     if bondwires: # bond parameters patched through kwargs
         num_bonds = int(length/bond_pitch)
-        this_struct = struct().clone()
-        this_struct.shiftPos(bond_pitch)
         if not incl_end_bond: num_bonds -= 1
-        for i in range(num_bonds):
-            Airbridge(chip, this_struct, **kwargs)
-            this_struct.shiftPos(bond_pitch)
+        if num_bonds > 0: #skip the structure clone when there is nothing to draw
+            this_struct = struct.clone()
+            shift = this_struct.shiftPos #bind once for the loop
+            shift(bond_pitch)
+            for i in range(num_bonds):
+                Airbridge(chip, this_struct, **kwargs)
+                shift(bond_pitch)
 
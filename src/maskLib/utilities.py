@@ -7,28 +7,39 @@ Created on Mon Apr  6 11:53:13 2020
 from dxfwrite import DXFEngine as dxf
 from dxfwrite.algebra import rotate_2d
 from dxfwrite.vector2d import vadd,midpoint,vmul_scalar,vsub
+from functools import lru_cache
 import math
+import numpy as np
 
 # ===============================================================================
-#  UTILITY FUNCTIONS  
+#  UTILITY FUNCTIONS
 # ===============================================================================
-     
+
+
+@lru_cache(maxsize=256)
+def unitArc(angleDeg,segments):
+    # unit-circle sample table for an arc: cos/sin of i*angle/segments for i in 0..segments
+    # cached since arcs are sampled with the same few (angle, density) combinations all over a wafer
+    theta = (math.radians(angleDeg)/segments)*np.arange(segments+1)
+    return np.cos(theta),np.sin(theta)
 
 def curveAB(a,b,clockwise=True,angleDeg=90,ptDensity=120):
     # generate a segmented curve from A to B specified by angle. Point density = #pts / revolution
     # return list of points
     # clockwise can be boolean {1,0} or sign type {1,-1}
-    
+
     if clockwise == 0:
         clockwise = -1
-        
+
     angle = math.radians(angleDeg)
     segments = int(angle/(2*math.pi) *ptDensity)
     center = vadd(midpoint(a,b),vmul_scalar(rotate_2d(vsub(b,a),-clockwise*math.pi/2),0.5/math.tan(angle/2)))
-    points = []
-    for i in range(segments+1):
-        points.append(vadd(center,rotate_2d(vsub(a,center),-clockwise*i*angle/segments)))
-    return points
+    cos_t,sin_t = unitArc(angleDeg,segments)
+    sin_t = -clockwise*sin_t
+    vx,vy = a[0]-center[0],a[1]-center[1]
+    xs = center[0] + (vx*cos_t - vy*sin_t)
+    ys = center[1] + (vy*cos_t + vx*sin_t)
+    return list(zip(xs.tolist(),ys.tolist()))
 
 def cornerRound(vertex,quadrant,radius,clockwise=True,ptDensity=120):
     #quadrant corresponds to quadrants 1-4
@@ -49,8 +60,12 @@ def transformedQuadrants(vflip=False,hflip=False):
     
     return vflip==False and (hflip==False and [0,1,2,3,4] or [0,2,1,4,3]) or (hflip==False and [0,4,3,2,1] or [0,3,4,1,2])
 
-def kwargStrip(kwargs,keys=['layer']):
+_STRIP_KEYS = ('layer',)
+
+def kwargStrip(kwargs,keys=_STRIP_KEYS):
     # return kwargs with only entries specified by keys
+    if not kwargs:
+        return {}
     return {k:kwargs[k] for k in keys if k in kwargs}
 
 